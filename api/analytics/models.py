@@ -2,9 +2,50 @@
 Pydantic models for Analytics API
 """
 
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+
+import datetime as dt
+from typing import Annotated, Optional, List, Dict, Any, Literal, NamedTuple
 from datetime import datetime, date
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    AliasChoices, BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter,
+    model_validator
+)
+
+# Shared config for analytics models: instances are built from service-computed
+# values and never mutated after construction, so they are frozen (letting
+# pydantic-core skip mutation-path checks). Schema construction is deferred to
+# first use so importing this module stays cheap at app cold start.
+ANALYTICS_MODEL_CONFIG = ConfigDict(frozen=True, from_attributes=True, defer_build=True)
+
+# Accepted analysis periods, declared as Literals so FastAPI validates them
+# with a pydantic-core hash lookup instead of Python string comparisons
+AnalysisPeriod = Literal["7_days", "30_days", "90_days", "1_year"]
+VelocityPeriod = Literal["7_days", "30_days", "90_days"]
+
+# Shared ISO-date parser for query params, compiled once instead of being
+# re-derived by FastAPI for every route that declares a date parameter
+_DATE_ADAPTER = TypeAdapter(date)
+
+
+def _parse_date(value: Any) -> Any:
+    if value is None or isinstance(value, date):
+        return value
+    return _DATE_ADAPTER.validate_python(value)
+
+
+FastDate = Annotated[date, BeforeValidator(_parse_date)]
+
+
+def _none_to_zero(value: Any) -> Any:
+    return 0 if value is None else value
+
+
+# Count/rate columns come back as NULL from the aggregating views when a user
+# has no matching rows; coalescing here keeps the hot service loops free of
+# per-field `or 0` handling and lets rows be validated in bulk.
+NullableCount = Annotated[int, BeforeValidator(_none_to_zero)]
+NullableRate = Annotated[float, BeforeValidator(_none_to_zero)]
 
 
 class DateRange(BaseModel):
@@ -12,12 +53,21 @@ class DateRange(BaseModel):
     start_date: Optional[date] = Field(None, description="Start date for analysis")
     end_date: Optional[date] = Field(None, description="End date for analysis")
 
-    @validator('end_date')
-    def validate_date_range(cls, v: Optional[date], values: Dict[str, Any]) -> Optional[date]:
-        if v and 'start_date' in values and values['start_date']:
-            if v < values['start_date']:
-                raise ValueError("End date must be after start date")
-        return v
+    @model_validator(mode='after')
+    def validate_date_range(self) -> 'DateRange':
+        if self.end_date and self.start_date and self.end_date < self.start_date:
+            raise ValueError("End date must be after start date")
+        return self
+
+
+class _DateRangeInternal(NamedTuple):
+    """Lightweight date range passed from routes to the service layer.
+
+    The dates are already validated by FastAPI query coercion, so no
+    Pydantic model construction is needed on this internal path.
+    """
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
 
 
 class GoalProgressSummary(BaseModel):
@@ -27,16 +77,23 @@ class GoalProgressSummary(BaseModel):
     category: str = Field(..., description="Goal category")
     timeframe: str = Field(..., description="Goal timeframe")
     color: str = Field(..., description="Goal color")
-    total_tasks: int = Field(default=0, ge=0, description="Total number of tasks")
-    completed_tasks: int = Field(default=0, ge=0, description="Number of completed tasks")
-    active_tasks: int = Field(default=0, ge=0, description="Number of active tasks")
-    completion_rate: float = Field(default=0.0, ge=0, le=100, description="Completion percentage")
-    average_task_age: float = Field(default=0.0, ge=0, description="Average age of active tasks in days")
+    total_tasks: NullableCount = Field(default=0, ge=0, description="Total number of tasks")
+    completed_tasks: NullableCount = Field(default=0, ge=0, description="Number of completed tasks")
+    active_tasks: NullableCount = Field(default=0, ge=0, description="Number of active tasks")
+    completion_rate: NullableRate = Field(default=0.0, ge=0, le=100, description="Completion percentage")
+    average_task_age: NullableRate = Field(default=0.0, ge=0, description="Average age of active tasks in days")
     last_activity_at: Optional[datetime] = Field(None, description="Last activity timestamp")
     goal_created_at: datetime = Field(..., description="Goal creation timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ANALYTICS_MODEL_CONFIG
+
+
+# Columns the service projects from the goal_stats view; kept beside the
+# model so a field added above is also added here
+GOAL_STATS_COLUMNS = (
+    "goal_id,goal_title,category,timeframe,color,total_tasks,completed_tasks,"
+    "active_tasks,completion_rate,average_task_age,last_activity_at,goal_created_at"
+)
 
 
 class QuadrantDistribution(BaseModel):
@@ -54,62 +111,156 @@ class QuadrantDistribution(BaseModel):
     q4_percentage: float = Field(default=0.0, ge=0, le=100, description="Q4 percentage")
     staging_percentage: float = Field(default=0.0, ge=0, le=100, description="Staging percentage")
 
-    class Config:
-        from_attributes = True
+    model_config = ANALYTICS_MODEL_CONFIG
+
+    @model_validator(mode='before')
+    @classmethod
+    def _derive_percentages(cls, data: Any) -> Any:
+        """Derive the percentages from the counts when the row lacks them
+
+        Rows that arrive through the dashboard RPC are to_jsonb() dumps of
+        the quadrant_distribution view, which on a not-yet-migrated database
+        carries only the counts; without this the percentage fields would
+        silently validate to their 0.0 defaults.
+        """
+        if isinstance(data, dict) and "q1_percentage" not in data:
+            total = data.get("total_active_tasks") or 0
+            data = dict(data)
+            for quadrant in ("q1", "q2", "q3", "q4", "staging"):
+                count = data.get(f"{quadrant}_count") or 0
+                data[f"{quadrant}_percentage"] = (
+                    round(count * 100.0 / total, 2) if total else 0.0
+                )
+        return data
+
+
+# Only the columns the quadrant_distribution view actually defines
+# (migration 003): the per-quadrant percentages are derived from the counts
+# in Python, so PostgREST never sees a column it would reject.
+QUADRANT_DISTRIBUTION_COLUMNS = (
+    "user_id,q1_count,q2_count,q3_count,q4_count,staging_count,total_active_tasks"
+)
 
 
 class ProductivityTrend(BaseModel):
     """Productivity trend model"""
-    date: date = Field(..., description="Date")
-    tasks_completed: int = Field(default=0, ge=0, description="Tasks completed on this date")
-    tasks_created: int = Field(default=0, ge=0, description="Tasks created on this date")
-    goals_created: int = Field(default=0, ge=0, description="Goals created on this date")
-    total_active_tasks: int = Field(default=0, ge=0, description="Total active tasks at end of day")
+    model_config = ANALYTICS_MODEL_CONFIG
+
+    date: dt.date = Field(..., validation_alias=AliasChoices("date", "trend_date"), description="Date")
+    tasks_completed: NullableCount = Field(default=0, ge=0, description="Tasks completed on this date")
+    tasks_created: NullableCount = Field(default=0, ge=0, description="Tasks created on this date")
+    goals_created: NullableCount = Field(default=0, ge=0, description="Goals created on this date")
+    total_active_tasks: NullableCount = Field(default=0, ge=0, description="Total active tasks at end of day")
+
+
+PRODUCTIVITY_TRENDS_COLUMNS = "trend_date,tasks_completed,tasks_created,goals_created,total_active_tasks"
 
 
 class TimeframeSummary(BaseModel):
     """Timeframe summary model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     timeframe: str = Field(..., description="Goal timeframe")
-    total_goals: int = Field(default=0, ge=0, description="Total goals in timeframe")
-    active_goals: int = Field(default=0, ge=0, description="Active goals in timeframe")
-    completed_goals: int = Field(default=0, ge=0, description="Completed goals in timeframe")
-    total_tasks: int = Field(default=0, ge=0, description="Total tasks in timeframe")
-    completed_tasks: int = Field(default=0, ge=0, description="Completed tasks in timeframe")
-    average_completion_rate: float = Field(default=0.0, ge=0, le=100, description="Average completion rate")
+    total_goals: NullableCount = Field(default=0, ge=0, description="Total goals in timeframe")
+    active_goals: NullableCount = Field(default=0, ge=0, description="Active goals in timeframe")
+    completed_goals: NullableCount = Field(default=0, ge=0, description="Completed goals in timeframe")
+    total_tasks: NullableCount = Field(default=0, ge=0, description="Total tasks in timeframe")
+    completed_tasks: NullableCount = Field(default=0, ge=0, description="Completed tasks in timeframe")
+    average_completion_rate: NullableRate = Field(default=0.0, ge=0, le=100, description="Average completion rate")
+
+
+TIMEFRAME_ANALYSIS_COLUMNS = (
+    "timeframe,total_goals,active_goals,completed_goals,total_tasks,"
+    "completed_tasks,average_completion_rate"
+)
 
 
 class CategorySummary(BaseModel):
     """Category summary model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     category: str = Field(..., description="Goal category")
-    total_goals: int = Field(default=0, ge=0, description="Total goals in category")
-    active_goals: int = Field(default=0, ge=0, description="Active goals in category")
-    completed_goals: int = Field(default=0, ge=0, description="Completed goals in category")
-    total_tasks: int = Field(default=0, ge=0, description="Total tasks in category")
-    completed_tasks: int = Field(default=0, ge=0, description="Completed tasks in category")
-    average_completion_rate: float = Field(default=0.0, ge=0, le=100, description="Average completion rate")
+    total_goals: NullableCount = Field(default=0, ge=0, description="Total goals in category")
+    active_goals: NullableCount = Field(default=0, ge=0, description="Active goals in category")
+    completed_goals: NullableCount = Field(default=0, ge=0, description="Completed goals in category")
+    total_tasks: NullableCount = Field(default=0, ge=0, description="Total tasks in category")
+    completed_tasks: NullableCount = Field(default=0, ge=0, description="Completed tasks in category")
+    average_completion_rate: NullableRate = Field(default=0.0, ge=0, le=100, description="Average completion rate")
+
+
+CATEGORY_ANALYSIS_COLUMNS = (
+    "category,total_goals,active_goals,completed_goals,total_tasks,"
+    "completed_tasks,average_completion_rate"
+)
 
 
 class PriorityAnalysis(BaseModel):
     """Priority analysis model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     priority: str = Field(..., description="Task priority")
-    total_tasks: int = Field(default=0, ge=0, description="Total tasks with this priority")
-    completed_tasks: int = Field(default=0, ge=0, description="Completed tasks with this priority")
-    overdue_tasks: int = Field(default=0, ge=0, description="Overdue tasks with this priority")
-    completion_rate: float = Field(default=0.0, ge=0, le=100, description="Completion rate for this priority")
+    total_tasks: NullableCount = Field(default=0, ge=0, description="Total tasks with this priority")
+    completed_tasks: NullableCount = Field(default=0, ge=0, description="Completed tasks with this priority")
+    overdue_tasks: NullableCount = Field(default=0, ge=0, description="Overdue tasks with this priority")
+    completion_rate: NullableRate = Field(default=0.0, ge=0, le=100, description="Completion rate for this priority")
     average_completion_time: Optional[float] = Field(None, ge=0, description="Average completion time in days")
 
 
+PRIORITY_ANALYSIS_COLUMNS = (
+    "priority,total_tasks,completed_tasks,overdue_tasks,completion_rate,"
+    "average_completion_time"
+)
+
+
+class OverdueByQuadrant(BaseModel):
+    """Overdue task counts per quadrant"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
+    # serialization_alias keeps the public payload keys ("Q1".."Q4") the
+    # dict-based implementation produced; AliasChoices only affects parsing
+    q1: int = Field(default=0, ge=0, validation_alias=AliasChoices("q1", "Q1"), serialization_alias="Q1", description="Overdue Q1 tasks")
+    q2: int = Field(default=0, ge=0, validation_alias=AliasChoices("q2", "Q2"), serialization_alias="Q2", description="Overdue Q2 tasks")
+    q3: int = Field(default=0, ge=0, validation_alias=AliasChoices("q3", "Q3"), serialization_alias="Q3", description="Overdue Q3 tasks")
+    q4: int = Field(default=0, ge=0, validation_alias=AliasChoices("q4", "Q4"), serialization_alias="Q4", description="Overdue Q4 tasks")
+    staging: int = Field(default=0, ge=0, description="Overdue staged tasks")
+
+
+class OverdueByPriority(BaseModel):
+    """Overdue task counts per priority"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
+    low: int = Field(default=0, ge=0, description="Overdue low priority tasks")
+    medium: int = Field(default=0, ge=0, description="Overdue medium priority tasks")
+    high: int = Field(default=0, ge=0, description="Overdue high priority tasks")
+    urgent: int = Field(default=0, ge=0, description="Overdue urgent priority tasks")
+
+
+class OverdueByDays(BaseModel):
+    """Overdue task counts grouped by age range"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
+    # serialization_alias preserves the "1_7_days"-style public keys; the
+    # field names exist because a Python identifier cannot start with a digit
+    days_1_7: int = Field(default=0, ge=0, validation_alias=AliasChoices("days_1_7", "1_7_days"), serialization_alias="1_7_days", description="Overdue 1-7 days")
+    days_8_30: int = Field(default=0, ge=0, validation_alias=AliasChoices("days_8_30", "8_30_days"), serialization_alias="8_30_days", description="Overdue 8-30 days")
+    days_over_30: int = Field(default=0, ge=0, validation_alias=AliasChoices("days_over_30", "over_30_days"), serialization_alias="over_30_days", description="Overdue more than 30 days")
+
+
 class OverdueAnalysis(BaseModel):
     """Overdue tasks analysis model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     total_overdue: int = Field(default=0, ge=0, description="Total overdue tasks")
-    overdue_by_quadrant: Dict[str, int] = Field(default_factory=dict, description="Overdue tasks by quadrant")
-    overdue_by_priority: Dict[str, int] = Field(default_factory=dict, description="Overdue tasks by priority")
-    overdue_by_days: Dict[str, int] = Field(default_factory=dict, description="Overdue tasks by age ranges")
+    overdue_by_quadrant: OverdueByQuadrant = Field(default_factory=OverdueByQuadrant, description="Overdue tasks by quadrant")
+    overdue_by_priority: OverdueByPriority = Field(default_factory=OverdueByPriority, description="Overdue tasks by priority")
+    overdue_by_days: OverdueByDays = Field(default_factory=OverdueByDays, description="Overdue tasks by age ranges")
     oldest_overdue_task: Optional[Dict[str, Any]] = Field(None, description="Information about oldest overdue task")
 
 
 class CompletionVelocity(BaseModel):
     """Task completion velocity model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     period: str = Field(..., description="Period (week, month, quarter)")
     tasks_completed: int = Field(default=0, ge=0, description="Tasks completed in period")
     goals_completed: int = Field(default=0, ge=0, description="Goals completed in period")
@@ -119,6 +270,8 @@ class CompletionVelocity(BaseModel):
 
 class StagingZoneAnalytics(BaseModel):
     """Staging zone analytics model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     average_staging_time: float = Field(default=0.0, ge=0, description="Average time items spend in staging (days)")
     total_staged_items: int = Field(default=0, ge=0, description="Total items ever staged")
     items_organized_from_staging: int = Field(default=0, ge=0, description="Items successfully organized")
@@ -128,6 +281,8 @@ class StagingZoneAnalytics(BaseModel):
 
 class UserProductivityScore(BaseModel):
     """User productivity score model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     overall_score: float = Field(..., ge=0, le=100, description="Overall productivity score")
     goal_completion_score: float = Field(..., ge=0, le=100, description="Goal completion score")
     task_completion_score: float = Field(..., ge=0, le=100, description="Task completion score")
@@ -140,6 +295,8 @@ class UserProductivityScore(BaseModel):
 
 class AnalyticsDashboard(BaseModel):
     """Complete analytics dashboard model"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     period: str = Field(..., description="Analytics period")
     generated_at: datetime = Field(..., description="Report generation timestamp")
     
@@ -149,21 +306,23 @@ class AnalyticsDashboard(BaseModel):
     completed_tasks: int = Field(default=0, ge=0, description="Total completed tasks")
     overdue_tasks: int = Field(default=0, ge=0, description="Total overdue tasks")
     
-    # Simplified analytics (using basic types to avoid circular dependencies)
-    goal_progress: List[Dict[str, Any]] = Field(default_factory=list, description="Goal progress summaries")
-    quadrant_distribution: Dict[str, Any] = Field(default_factory=dict, description="Task quadrant distribution")
-    productivity_trends: List[Dict[str, Any]] = Field(default_factory=list, description="Daily productivity trends")
-    timeframe_analysis: List[Dict[str, Any]] = Field(default_factory=list, description="Analysis by timeframe")
-    category_analysis: List[Dict[str, Any]] = Field(default_factory=list, description="Analysis by category")
-    priority_analysis: List[Dict[str, Any]] = Field(default_factory=list, description="Analysis by priority")
-    overdue_analysis: Dict[str, Any] = Field(default_factory=dict, description="Overdue tasks analysis")
-    completion_velocity: Dict[str, Any] = Field(default_factory=dict, description="Task completion velocity")
-    staging_analytics: Dict[str, Any] = Field(default_factory=dict, description="Staging zone analytics")
-    productivity_score: Dict[str, Any] = Field(default_factory=dict, description="User productivity score")
+    # Typed analytics components
+    goal_progress: List[GoalProgressSummary] = Field(default_factory=list, description="Goal progress summaries")
+    quadrant_distribution: Optional[QuadrantDistribution] = Field(None, description="Task quadrant distribution")
+    productivity_trends: List[ProductivityTrend] = Field(default_factory=list, description="Daily productivity trends")
+    timeframe_analysis: List[TimeframeSummary] = Field(default_factory=list, description="Analysis by timeframe")
+    category_analysis: List[CategorySummary] = Field(default_factory=list, description="Analysis by category")
+    priority_analysis: List[PriorityAnalysis] = Field(default_factory=list, description="Analysis by priority")
+    overdue_analysis: Optional[OverdueAnalysis] = Field(None, description="Overdue tasks analysis")
+    completion_velocity: Optional[CompletionVelocity] = Field(None, description="Task completion velocity")
+    staging_analytics: Optional[StagingZoneAnalytics] = Field(None, description="Staging zone analytics")
+    productivity_score: Optional[UserProductivityScore] = Field(None, description="User productivity score")
 
 
 class AnalyticsFilters(BaseModel):
     """Analytics filtering parameters"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     user_id: str = Field(..., min_length=1, max_length=255, description="User identifier")
     date_range: Optional[DateRange] = Field(None, description="Date range for analysis")
     goal_ids: Optional[List[str]] = Field(None, max_items=50, description="Specific goal IDs to analyze")
@@ -176,6 +335,8 @@ class AnalyticsFilters(BaseModel):
 # Response models for specific endpoints
 class GoalProgressResponse(BaseModel):
     """Goal progress endpoint response"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     goals: List[GoalProgressSummary] = Field(..., description="Goal progress summaries")
     total_goals: int = Field(..., ge=0, description="Total number of goals")
     average_completion_rate: float = Field(..., ge=0, le=100, description="Average completion rate across all goals")
@@ -183,6 +344,8 @@ class GoalProgressResponse(BaseModel):
 
 class QuadrantAnalysisResponse(BaseModel):
     """Quadrant analysis endpoint response"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     distribution: QuadrantDistribution = Field(..., description="Current quadrant distribution")
     recommendations: List[str] = Field(default_factory=list, description="Quadrant balance recommendations")
     ideal_distribution: Dict[str, float] = Field(default_factory=dict, description="Recommended quadrant percentages")
@@ -190,8 +353,22 @@ class QuadrantAnalysisResponse(BaseModel):
 
 class ProductivityInsightsResponse(BaseModel):
     """Productivity insights endpoint response"""
+    model_config = ANALYTICS_MODEL_CONFIG
+
     productivity_score: UserProductivityScore = Field(..., description="Overall productivity score")
     trends: List[ProductivityTrend] = Field(..., description="Recent productivity trends")
     velocity: CompletionVelocity = Field(..., description="Task completion velocity")
     insights: List[str] = Field(default_factory=list, description="Key productivity insights")
     action_items: List[str] = Field(default_factory=list, description="Recommended action items")
+
+
+# Prebuilt adapters for batch (de)serialization of analytics list payloads.
+# Created once at module scope so routes do not re-derive schemas per request;
+# schema construction itself is deferred to first use like the models above.
+_ADAPTER_CONFIG = ConfigDict(defer_build=True)
+
+GOAL_PROGRESS_LIST_ADAPTER = TypeAdapter(List[GoalProgressSummary], config=_ADAPTER_CONFIG)
+TREND_LIST_ADAPTER = TypeAdapter(List[ProductivityTrend], config=_ADAPTER_CONFIG)
+TIMEFRAME_LIST_ADAPTER = TypeAdapter(List[TimeframeSummary], config=_ADAPTER_CONFIG)
+CATEGORY_LIST_ADAPTER = TypeAdapter(List[CategorySummary], config=_ADAPTER_CONFIG)
+PRIORITY_LIST_ADAPTER = TypeAdapter(List[PriorityAnalysis], config=_ADAPTER_CONFIG)
@@ -2,33 +2,46 @@
 Analytics API routes
 """
 
-import logging
-from typing import Optional
-from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query
-from supabase import Client
-
-from api.dependencies import get_db, get_user_id_from_query
-from api.analytics.service import AnalyticsService
+from typing import AsyncIterator, Optional
+from datetime import date, datetime
+
+import orjson
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from api.dependencies import (
+    get_analytics_etag, get_analytics_service, get_user_id_from_query
+)
+from api.analytics.service import AnalyticsService, note_dashboard_access
+# Handlers return the success_response envelope directly; no response_model
+# is declared so FastAPI does not re-validate the already-built payload.
 from api.analytics.models import (
-    AnalyticsDashboard, DateRange, GoalProgressResponse, QuadrantAnalysisResponse,
-    ProductivityInsightsResponse, QuadrantDistribution, UserProductivityScore
+    AnalysisPeriod, FastDate, VelocityPeriod, _DateRangeInternal,
+    TREND_LIST_ADAPTER, TIMEFRAME_LIST_ADAPTER,
+    CATEGORY_LIST_ADAPTER, PRIORITY_LIST_ADAPTER
 )
 from api.shared.responses import success_response
-from api.shared.exceptions import QuadrantPlannerException
 
-logger = logging.getLogger(__name__)
+# orjson serializes the large analytics payloads considerably faster than
+# the default JSONResponse encoder
+router = APIRouter(default_response_class=ORJSONResponse)
 
-router = APIRouter()
+# Hot callables bound once at module scope so handlers skip the repeated
+# attribute lookups on every request
+_utcnow = datetime.utcnow
+_json_fragment = orjson.Fragment
+_json_dumps = orjson.dumps
 
 
-@router.get("/dashboard", response_model=AnalyticsDashboard)
+@router.get("/dashboard")
 async def get_analytics_dashboard(
     user_id: str = Depends(get_user_id_from_query),
-    period: str = Query("30_days", description="Analysis period (7_days, 30_days, 90_days, 1_year)"),
-    start_date: Optional[date] = Query(None, description="Custom start date (YYYY-MM-DD)"),
-    end_date: Optional[date] = Query(None, description="Custom end date (YYYY-MM-DD)"),
-    db: Client = Depends(get_db)
+    period: AnalysisPeriod = Query("30_days", description="Analysis period (7_days, 30_days, 90_days, 1_year)"),
+    start_date: Optional[FastDate] = Query(None, description="Custom start date (YYYY-MM-DD)"),
+    end_date: Optional[FastDate] = Query(None, description="Custom end date (YYYY-MM-DD)"),
+    refresh: bool = Query(False, description="Bypass the cached dashboard and recompute"),
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get comprehensive analytics dashboard
@@ -48,35 +61,37 @@ async def get_analytics_dashboard(
     - Staging zone analytics
     - Productivity score with recommendations
     """
-    try:
-        service = AnalyticsService(db)
-        
-        # Create date range if custom dates provided
-        date_range = None
-        if start_date or end_date:
-            date_range = DateRange(start_date=start_date, end_date=end_date)
-        
-        dashboard = await service.get_dashboard(
-            user_id=user_id,
-            period=period,
-            date_range=date_range
-        )
-        
-        return success_response(dashboard)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get analytics dashboard: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    # Create date range if custom dates provided
+    date_range = None
+    if start_date or end_date:
+        date_range = _DateRangeInternal(start_date, end_date)
+
+    note_dashboard_access(user_id)
+    dashboard = await service.get_dashboard(
+        user_id=user_id,
+        period=period,
+        date_range=date_range,
+        refresh=refresh
+    )
+    
+    # Serialize the large dashboard tree once with the pydantic-core Rust
+    # serializer and splice the resulting JSON into the envelope, instead
+    # of walking the whole model again through jsonable_encoder
+    return ORJSONResponse(content={
+        "success": True,
+        "data": _json_fragment(dashboard.model_dump_json()),
+        "message": None,
+        "timestamp": _utcnow()
+    }, headers={"ETag": etag})
 
 
-@router.get("/goals/progress", response_model=GoalProgressResponse)
+@router.get("/goals/progress")
 async def get_goal_progress(
     user_id: str = Depends(get_user_id_from_query),
-    start_date: Optional[date] = Query(None, description="Filter goals created after this date"),
-    end_date: Optional[date] = Query(None, description="Filter goals created before this date"),
-    db: Client = Depends(get_db)
+    start_date: Optional[FastDate] = Query(None, description="Filter goals created after this date"),
+    end_date: Optional[FastDate] = Query(None, description="Filter goals created before this date"),
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get goal progress analytics
@@ -91,28 +106,21 @@ async def get_goal_progress(
     - Last activity timestamps
     - Overall completion statistics
     """
-    try:
-        service = AnalyticsService(db)
-        
-        date_range = None
-        if start_date or end_date:
-            date_range = DateRange(start_date=start_date, end_date=end_date)
-        
-        progress = await service.get_goal_progress(user_id, date_range)
-        
-        return success_response(progress)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get goal progress: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    date_range = None
+    if start_date or end_date:
+        date_range = _DateRangeInternal(start_date, end_date)
+    
+    progress = await service.get_goal_progress(user_id, date_range)
+    
+    return success_response(progress, headers={"ETag": etag})
 
 
-@router.get("/quadrants/analysis", response_model=QuadrantAnalysisResponse)
+@router.get("/quadrants/analysis")
 async def get_quadrant_analysis(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    refresh: bool = Query(False, description="Bypass the cached analysis and recompute"),
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get quadrant distribution analysis with recommendations
@@ -125,23 +133,16 @@ async def get_quadrant_analysis(
     - Optimization recommendations
     - Ideal distribution targets
     """
-    try:
-        service = AnalyticsService(db)
-        analysis = await service.get_quadrant_analysis(user_id)
-        
-        return success_response(analysis)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get quadrant analysis: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    analysis = await service.get_quadrant_analysis(user_id, refresh=refresh)
+    
+    return success_response(analysis, headers={"ETag": etag})
 
 
-@router.get("/quadrants/distribution", response_model=QuadrantDistribution)
+@router.get("/quadrants/distribution")
 async def get_quadrant_distribution(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get current quadrant distribution
@@ -150,23 +151,17 @@ async def get_quadrant_distribution(
     
     Returns task counts and percentages for each quadrant (Q1-Q4, staging)
     """
-    try:
-        service = AnalyticsService(db)
-        distribution = await service.get_quadrant_distribution(user_id)
-        
-        return success_response(distribution)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get quadrant distribution: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    distribution = await service.get_quadrant_distribution(user_id)
+    
+    return success_response(distribution, headers={"ETag": etag})
 
 
-@router.get("/productivity/insights", response_model=ProductivityInsightsResponse)
+@router.get("/productivity/insights")
 async def get_productivity_insights(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    refresh: bool = Query(False, description="Bypass the cached insights and recompute"),
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get comprehensive productivity insights and recommendations
@@ -179,23 +174,16 @@ async def get_productivity_insights(
     - Task completion velocity
     - Actionable insights and recommendations
     """
-    try:
-        service = AnalyticsService(db)
-        insights = await service.get_productivity_insights(user_id)
-        
-        return success_response(insights)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get productivity insights: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    insights = await service.get_productivity_insights(user_id, refresh=refresh)
+    
+    return success_response(insights, headers={"ETag": etag})
 
 
-@router.get("/productivity/score", response_model=UserProductivityScore)
+@router.get("/productivity/score")
 async def get_productivity_score(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get user productivity score
@@ -208,25 +196,18 @@ async def get_productivity_score(
     - Score trend analysis
     - Personalized recommendations
     """
-    try:
-        service = AnalyticsService(db)
-        score = await service.calculate_productivity_score(user_id)
-        
-        return success_response(score)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get productivity score: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    score = await service.calculate_productivity_score(user_id)
+    
+    return success_response(score, headers={"ETag": etag})
 
 
 @router.get("/trends/productivity")
 async def get_productivity_trends(
     user_id: str = Depends(get_user_id_from_query),
-    start_date: date = Query(..., description="Start date for trend analysis"),
-    end_date: date = Query(..., description="End date for trend analysis"),
-    db: Client = Depends(get_db)
+    start_date: FastDate = Query(..., description="Start date for trend analysis"),
+    end_date: FastDate = Query(..., description="End date for trend analysis"),
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get daily productivity trends over a date range
@@ -240,31 +221,34 @@ async def get_productivity_trends(
     - Tasks created per day
     - Goals created per day
     - Total active tasks at end of day
+    
+    Ranges longer than 90 days are streamed as NDJSON (one trend per line)
+    so time-to-first-byte does not wait on the full payload.
     """
-    try:
-        service = AnalyticsService(db)
-        
-        date_range = DateRange(start_date=start_date, end_date=end_date)
-        trends = await service.get_productivity_trends(user_id, date_range)
-        
-        return success_response({
-            "trends": trends,
-            "start_date": start_date,
-            "end_date": end_date,
-            "total_days": len(trends)
-        })
+    date_range = _DateRangeInternal(start_date, end_date)
+    
+    if (end_date - start_date).days > 90:
+        async def ndjson_trends() -> AsyncIterator[bytes]:
+            async for trend in service.iter_productivity_trends(user_id, date_range):
+                yield _json_dumps(trend.model_dump()) + b"\n"
         
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get productivity trends: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+        return StreamingResponse(ndjson_trends(), media_type="application/x-ndjson", headers={"ETag": etag})
+    
+    trends = await service.get_productivity_trends(user_id, date_range)
+    
+    return success_response({
+        "trends": TREND_LIST_ADAPTER.dump_python(trends, mode='json'),
+        "start_date": start_date,
+        "end_date": end_date,
+        "total_days": len(trends)
+    }, headers={"ETag": etag})
 
 
 @router.get("/analysis/timeframes")
 async def get_timeframe_analysis(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get analysis by goal timeframes
@@ -274,26 +258,19 @@ async def get_timeframe_analysis(
     Returns goal and task statistics grouped by timeframe:
     - 1_week, 1_month, 3_months, 6_months, 1_year, ongoing
     """
-    try:
-        service = AnalyticsService(db)
-        analysis = await service.get_timeframe_analysis(user_id)
-        
-        return success_response({
-            "timeframe_analysis": analysis,
-            "total_timeframes": len(analysis)
-        })
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get timeframe analysis: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    analysis = await service.get_timeframe_analysis(user_id)
+    
+    return success_response({
+        "timeframe_analysis": TIMEFRAME_LIST_ADAPTER.dump_python(analysis, mode='json'),
+        "total_timeframes": len(analysis)
+    }, headers={"ETag": etag})
 
 
 @router.get("/analysis/categories")
 async def get_category_analysis(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get analysis by goal categories
@@ -303,26 +280,19 @@ async def get_category_analysis(
     Returns goal and task statistics grouped by category:
     - health, career, learning, personal, relationships, financial, creative, other
     """
-    try:
-        service = AnalyticsService(db)
-        analysis = await service.get_category_analysis(user_id)
-        
-        return success_response({
-            "category_analysis": analysis,
-            "total_categories": len(analysis)
-        })
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get category analysis: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    analysis = await service.get_category_analysis(user_id)
+    
+    return success_response({
+        "category_analysis": CATEGORY_LIST_ADAPTER.dump_python(analysis, mode='json'),
+        "total_categories": len(analysis)
+    }, headers={"ETag": etag})
 
 
 @router.get("/analysis/priorities")
 async def get_priority_analysis(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get analysis by task priorities
@@ -333,26 +303,19 @@ async def get_priority_analysis(
     - low, medium, high, urgent
     - Includes completion rates and average completion times
     """
-    try:
-        service = AnalyticsService(db)
-        analysis = await service.get_priority_analysis(user_id)
-        
-        return success_response({
-            "priority_analysis": analysis,
-            "total_priorities": len(analysis)
-        })
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get priority analysis: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    analysis = await service.get_priority_analysis(user_id)
+    
+    return success_response({
+        "priority_analysis": PRIORITY_LIST_ADAPTER.dump_python(analysis, mode='json'),
+        "total_priorities": len(analysis)
+    }, headers={"ETag": etag})
 
 
 @router.get("/analysis/overdue")
 async def get_overdue_analysis(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get overdue tasks analysis
@@ -365,24 +328,17 @@ async def get_overdue_analysis(
     - Age-based groupings
     - Oldest overdue task details
     """
-    try:
-        service = AnalyticsService(db)
-        analysis = await service.get_overdue_analysis(user_id)
-        
-        return success_response(analysis)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get overdue analysis: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    analysis = await service.get_overdue_analysis(user_id)
+    
+    return success_response(analysis, headers={"ETag": etag})
 
 
 @router.get("/velocity/completion")
 async def get_completion_velocity(
     user_id: str = Depends(get_user_id_from_query),
-    period: str = Query("30_days", description="Analysis period (7_days, 30_days, 90_days)"),
-    db: Client = Depends(get_db)
+    period: VelocityPeriod = Query("30_days", description="Analysis period (7_days, 30_days, 90_days)"),
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get task completion velocity
@@ -396,23 +352,16 @@ async def get_completion_velocity(
     - Average tasks per day
     - Velocity trend direction
     """
-    try:
-        service = AnalyticsService(db)
-        velocity = await service.get_completion_velocity(user_id, period)
-        
-        return success_response(velocity)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get completion velocity: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    velocity = await service.get_completion_velocity(user_id, period)
+    
+    return success_response(velocity, headers={"ETag": etag})
 
 
 @router.get("/staging/analytics")
 async def get_staging_analytics(
     user_id: str = Depends(get_user_id_from_query),
-    db: Client = Depends(get_db)
+    service: AnalyticsService = Depends(get_analytics_service),
+    etag: str = Depends(get_analytics_etag)
 ):
     """
     Get staging zone analytics
@@ -425,14 +374,6 @@ async def get_staging_analytics(
     - Staging efficiency (% organized)
     - Current utilization
     """
-    try:
-        service = AnalyticsService(db)
-        analytics = await service.get_staging_analytics(user_id)
-        
-        return success_response(analytics)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get staging analytics: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    analytics = await service.get_staging_analytics(user_id)
+    
+    return success_response(analytics, headers={"ETag": etag})
@@ -2,23 +2,151 @@
 Analytics service layer - Business logic for analytics and insights
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from types import MappingProxyType
+from typing import AsyncIterator, List, Optional, Dict, Any, Callable
 from datetime import datetime, date, timedelta
+from cachetools import TTLCache
 from supabase import Client
 from api.analytics.models import (
     AnalyticsDashboard, GoalProgressSummary, QuadrantDistribution, ProductivityTrend,
     TimeframeSummary, CategorySummary, PriorityAnalysis, OverdueAnalysis,
+    OverdueByQuadrant, OverdueByPriority, OverdueByDays,
     CompletionVelocity, StagingZoneAnalytics, UserProductivityScore,
-    AnalyticsFilters, DateRange, GoalProgressResponse, QuadrantAnalysisResponse,
-    ProductivityInsightsResponse
+    AnalyticsFilters, GoalProgressResponse, QuadrantAnalysisResponse,
+    ProductivityInsightsResponse, _DateRangeInternal,
+    GOAL_STATS_COLUMNS, QUADRANT_DISTRIBUTION_COLUMNS, PRODUCTIVITY_TRENDS_COLUMNS,
+    TIMEFRAME_ANALYSIS_COLUMNS, CATEGORY_ANALYSIS_COLUMNS, PRIORITY_ANALYSIS_COLUMNS,
+    GOAL_PROGRESS_LIST_ADAPTER, TREND_LIST_ADAPTER, TIMEFRAME_LIST_ADAPTER,
+    CATEGORY_LIST_ADAPTER, PRIORITY_LIST_ADAPTER
 )
 # Database models import removed to avoid circular dependencies
+from api.shared.cache import bump_cache_version, cache_version, local_cache_version, redis_cached
 from api.shared.exceptions import DatabaseError, ValidationError
 from api.shared.validation import validate_user_id
 
 logger = logging.getLogger(__name__)
 
+# Covey's target quadrant split, shared by every quadrant analysis response.
+# Wrapped in a MappingProxyType so nothing can mutate the shared constant.
+IDEAL_QUADRANT_DISTRIBUTION = MappingProxyType({
+    "Q1": 20.0,  # Urgent + Important should be minimal
+    "Q2": 60.0,  # Important but not urgent should be majority
+    "Q3": 15.0,  # Urgent but not important should be limited
+    "Q4": 5.0,   # Neither should be minimal
+    "staging": 0.0  # Staging should be temporary
+})
+
+# Recommendations for users with no scoring data yet
+_EMPTY_SCORE_RECOMMENDATIONS = ("Create your first goal to start tracking productivity",)
+
+# Days covered by each analysis period; the period values themselves are
+# enforced at the API layer by the AnalysisPeriod Literal
+PERIOD_DAYS: Dict[str, int] = {"7_days": 7, "30_days": 30, "90_days": 90, "1_year": 365}
+
+# Short-lived in-process cache for per-user analytics reads. Dashboard data
+# changes on the order of minutes, so repeat hits within the TTL window are
+# served without re-querying Supabase. Accessed only from the event loop
+# thread, so no locking is required.
+_analytics_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+
+# Per-user version counters bumped by goal/task writes so cached analytics
+# are invalidated immediately instead of waiting out the TTL. The counter
+# lives in Redis next to the cached dashboards (in-process fallback when
+# Redis is absent), so a write on one instance invalidates every instance's
+# cache and the version survives serverless cold starts.
+
+
+async def analytics_cache_version(user_id: str) -> int:
+    """Current analytics cache version for a user"""
+    return await cache_version("analytics", user_id)
+
+
+async def bump_analytics_version(user_id: str) -> None:
+    """Invalidate cached analytics for a user after a goal/task write"""
+    await bump_cache_version("analytics", user_id)
+
+
+# Cache warming: dashboards of recently-active users are refreshed in the
+# background before their Redis TTL runs out, so those users never pay the
+# full aggregation cost on the request path.
+_WARM_INTERVAL_SECONDS = 300
+_WARM_ACTIVE_WINDOW_SECONDS = 1800
+_WARM_MAX_REFRESHES = 10  # stop refreshing entries nobody has read since
+
+_dashboard_access: Dict[str, float] = {}
+_warm_refresh_counts: Dict[str, int] = {}
+
+
+def note_dashboard_access(user_id: str) -> None:
+    """Record dashboard activity so the cache warmer keeps this user fresh"""
+    _dashboard_access[user_id] = time.time()
+    _warm_refresh_counts[user_id] = 0
+
+
+async def warm_dashboard_caches() -> None:
+    """Refresh cached dashboards for recently-active users"""
+    from database.connection import get_supabase_client
+
+    service = AnalyticsService(get_supabase_client())
+    now = time.time()
+    for user_id, last_access in list(_dashboard_access.items()):
+        if now - last_access > _WARM_ACTIVE_WINDOW_SECONDS:
+            _dashboard_access.pop(user_id, None)
+            _warm_refresh_counts.pop(user_id, None)
+            continue
+        if _warm_refresh_counts.get(user_id, 0) >= _WARM_MAX_REFRESHES:
+            continue
+        _warm_refresh_counts[user_id] = _warm_refresh_counts.get(user_id, 0) + 1
+        try:
+            await service.get_dashboard(user_id, refresh=True)
+        except Exception as e:
+            logger.debug(f"Dashboard warm-up failed for user {user_id}: {e}")
+
+
+async def run_dashboard_cache_warmer() -> None:
+    """Background loop that keeps active users' dashboards warm"""
+    while True:
+        await asyncio.sleep(_WARM_INTERVAL_SECONDS)
+        await warm_dashboard_caches()
+
+
+# Async key builders for the Redis-cached reads: the embedded version
+# counter is itself a Redis read, so the keys are awaited by redis_cached
+async def _dashboard_cache_key(
+    self: "AnalyticsService",
+    user_id: str,
+    period: str = "30_days",
+    date_range: Optional[_DateRangeInternal] = None
+) -> str:
+    return f"analytics:dashboard:{user_id}:v{await analytics_cache_version(user_id)}:{period}:{date_range}"
+
+
+async def _quadrant_analysis_cache_key(self: "AnalyticsService", user_id: str) -> str:
+    return f"analytics:quadrant_analysis:{user_id}:v{await analytics_cache_version(user_id)}"
+
+
+async def _insights_cache_key(self: "AnalyticsService", user_id: str) -> str:
+    return f"analytics:insights:{user_id}:v{await analytics_cache_version(user_id)}"
+
+
+def _cached_analytics(func: Callable) -> Callable:
+    """Cache an async analytics read keyed by method, user version and args"""
+    @functools.wraps(func)
+    async def wrapper(self: "AnalyticsService", user_id: str, *args: Any) -> Any:
+        key = (func.__name__, user_id, local_cache_version("analytics", user_id), *args)
+        try:
+            return _analytics_cache[key]
+        except KeyError:
+            pass
+        value = await func(self, user_id, *args)
+        _analytics_cache[key] = value
+        return value
+    return wrapper
+
 
 class AnalyticsService:
     """Service class for analytics and insights business logic"""
@@ -26,11 +154,29 @@ class AnalyticsService:
     def __init__(self, db: Client):
         self.db = db
 
+    @staticmethod
+    async def _execute(query: Any) -> Any:
+        """Run a blocking supabase query off the event loop
+
+        supabase-py's execute() is a synchronous HTTP call; running it in a
+        worker thread lets gathered dashboard components (and other requests)
+        actually overlap instead of serializing on the event loop.
+        """
+        return await asyncio.to_thread(query.execute)
+
+    # Cross-instance Redis cache for the most expensive aggregations. Keys
+    # embed the per-user version counter, so writes roll the key forward and
+    # stale entries simply age out with the TTL.
+    @redis_cached(
+        AnalyticsDashboard,
+        ttl=300,
+        key_fn=_dashboard_cache_key
+    )
     async def get_dashboard(
         self,
         user_id: str,
         period: str = "30_days",
-        date_range: Optional[DateRange] = None
+        date_range: Optional[_DateRangeInternal] = None
     ) -> AnalyticsDashboard:
         """Get complete analytics dashboard"""
         try:
@@ -39,35 +185,47 @@ class AnalyticsService:
             # Calculate date range if not provided
             if not date_range:
                 end_date = date.today()
-                if period == "7_days":
-                    start_date = end_date - timedelta(days=7)
-                elif period == "30_days":
-                    start_date = end_date - timedelta(days=30)
-                elif period == "90_days":
-                    start_date = end_date - timedelta(days=90)
-                elif period == "1_year":
-                    start_date = end_date - timedelta(days=365)
-                else:
-                    start_date = end_date - timedelta(days=30)
-                
-                date_range = DateRange(start_date=start_date, end_date=end_date)
-
-            # Get all analytics components
-            goal_progress = await self.get_goal_progress(user_id, date_range)
-            quadrant_dist = await self.get_quadrant_distribution(user_id)
-            productivity_trends = await self.get_productivity_trends(user_id, date_range)
-            timeframe_analysis = await self.get_timeframe_analysis(user_id)
-            category_analysis = await self.get_category_analysis(user_id)
-            priority_analysis = await self.get_priority_analysis(user_id)
-            overdue_analysis = await self.get_overdue_analysis(user_id)
-            completion_velocity = await self.get_completion_velocity(user_id, period)
-            staging_analytics = await self.get_staging_analytics(user_id)
-            productivity_score = await self.calculate_productivity_score(user_id)
-
-            # Calculate summary metrics
-            total_goals = len([g for g in goal_progress.goals if g.active_tasks > 0 or g.completed_tasks > 0])
-            total_tasks = sum(g.total_tasks for g in goal_progress.goals)
-            completed_tasks = sum(g.completed_tasks for g in goal_progress.goals)
+                start_date = end_date - timedelta(days=PERIOD_DAYS.get(period, 30))
+                date_range = _DateRangeInternal(start_date, end_date)
+
+            # Prefer the single analytics_dashboard RPC, which assembles the
+            # full payload server-side in one round trip
+            dashboard = await self._get_dashboard_via_rpc(user_id, period, date_range)
+            if dashboard is not None:
+                logger.info(f"Generated analytics dashboard for user {user_id}")
+                return dashboard
+
+            # Get all analytics components concurrently - they are independent
+            (
+                goal_progress,
+                quadrant_dist,
+                productivity_trends,
+                timeframe_analysis,
+                category_analysis,
+                priority_analysis,
+                overdue_analysis,
+                completion_velocity,
+                staging_analytics,
+                productivity_score
+            ) = await asyncio.gather(
+                self.get_goal_progress(user_id, date_range),
+                self.get_quadrant_distribution(user_id),
+                self.get_productivity_trends(user_id, date_range),
+                self.get_timeframe_analysis(user_id),
+                self.get_category_analysis(user_id),
+                self.get_priority_analysis(user_id),
+                self.get_overdue_analysis(user_id),
+                self.get_completion_velocity(user_id, period),
+                self.get_staging_analytics(user_id),
+                self.calculate_productivity_score(user_id)
+            )
+
+            # Calculate summary metrics in a single pass over the goals
+            total_goals = total_tasks = completed_tasks = 0
+            for g in goal_progress.goals:
+                total_tasks += g.total_tasks
+                completed_tasks += g.completed_tasks
+                total_goals += g.active_tasks > 0 or g.completed_tasks > 0
             overdue_tasks = overdue_analysis.total_overdue
 
             dashboard = AnalyticsDashboard(
@@ -96,43 +254,116 @@ class AnalyticsService:
             logger.error(f"Failed to generate analytics dashboard for user {user_id}: {e}")
             raise DatabaseError("Failed to generate analytics dashboard")
 
+    async def _get_dashboard_via_rpc(
+        self,
+        user_id: str,
+        period: str,
+        date_range: _DateRangeInternal
+    ) -> Optional[AnalyticsDashboard]:
+        """Build the dashboard from the analytics_dashboard RPC, if available
+
+        Returns None when the RPC is missing or fails, so the caller can fall
+        back to the per-component query fan-out.
+        """
+        try:
+            result = await self._execute(self.db.rpc("analytics_dashboard", {
+                "user_id_param": user_id,
+                "period_param": period,
+                "start_date_param": date_range.start_date.isoformat() if date_range.start_date else None,
+                "end_date_param": date_range.end_date.isoformat() if date_range.end_date else None
+            }))
+        except Exception as e:
+            logger.debug(f"analytics_dashboard RPC unavailable, falling back to component queries: {e}")
+            return None
+
+        blob = result.data[0] if isinstance(result.data, list) and result.data else result.data
+        if not isinstance(blob, dict):
+            return None
+
+        return self._dashboard_from_blob(blob, period)
+
+    def _dashboard_from_blob(self, blob: Dict[str, Any], period: str) -> AnalyticsDashboard:
+        """Build an AnalyticsDashboard from an RPC-assembled JSON blob"""
+        # Summary metrics are aggregated server-side in the RPC; re-summing
+        # in Python remains only as a fallback for an older function version
+        summary = blob.get("summary")
+        if summary is None:
+            total_goals = total_tasks = completed_tasks = 0
+            for g in blob.get("goal_progress") or []:
+                total_tasks += g.get("total_tasks") or 0
+                completed_tasks += g.get("completed_tasks") or 0
+                total_goals += bool(g.get("active_tasks") or g.get("completed_tasks"))
+            summary = {
+                "total_goals": total_goals,
+                "total_tasks": total_tasks,
+                "completed_tasks": completed_tasks
+            }
+        overdue = blob.get("overdue_analysis") or {}
+
+        return AnalyticsDashboard.model_validate({
+            **blob,
+            "period": period,
+            "generated_at": datetime.utcnow(),
+            "total_goals": summary.get("total_goals") or 0,
+            "total_tasks": summary.get("total_tasks") or 0,
+            "completed_tasks": summary.get("completed_tasks") or 0,
+            "overdue_tasks": overdue.get("total_overdue") or 0
+        })
+
+    async def get_dashboards(
+        self,
+        user_ids: List[str],
+        period: str = "30_days"
+    ) -> Dict[str, AnalyticsDashboard]:
+        """Get dashboards for several users in a single database round trip
+
+        Intended for report/admin workflows; the fan-out over users happens
+        inside the analytics_dashboard_batch function rather than as N
+        separate dashboard requests.
+        """
+        try:
+            for user_id in user_ids:
+                validate_user_id(user_id)
+
+            result = await self._execute(self.db.rpc("analytics_dashboard_batch", {
+                "user_ids_param": user_ids,
+                "period_param": period
+            }))
+
+            dashboards: Dict[str, AnalyticsDashboard] = {}
+            for row in result.data or []:
+                blob = row.get("dashboard")
+                if isinstance(blob, dict):
+                    dashboards[row["user_id"]] = self._dashboard_from_blob(blob, period)
+
+            logger.info(f"Generated {len(dashboards)} dashboards in one batch")
+            return dashboards
+
+        except Exception as e:
+            logger.error(f"Failed to generate batched dashboards: {e}")
+            raise DatabaseError("Failed to generate analytics dashboards")
+
     async def get_goal_progress(
         self,
         user_id: str,
-        date_range: Optional[DateRange] = None
+        date_range: Optional[_DateRangeInternal] = None
     ) -> GoalProgressResponse:
         """Get goal progress analytics"""
         try:
             validate_user_id(user_id)
 
             # Query goal_stats view
-            query = self.db.table("goal_stats").select("*").eq("user_id", user_id)
+            query = self.db.table("goal_stats").select(GOAL_STATS_COLUMNS).eq("user_id", user_id)
             
             if date_range and date_range.start_date:
                 query = query.gte("goal_created_at", date_range.start_date.isoformat())
             if date_range and date_range.end_date:
                 query = query.lte("goal_created_at", date_range.end_date.isoformat())
 
-            result = query.execute()
+            result = await self._execute(query)
 
-            goals = []
-            if result.data:
-                for row in result.data:
-                    goal = GoalProgressSummary(
-                        goal_id=row["goal_id"],
-                        goal_title=row["goal_title"],
-                        category=row["category"],
-                        timeframe=row["timeframe"],
-                        color=row["color"],
-                        total_tasks=row["total_tasks"] or 0,
-                        completed_tasks=row["completed_tasks"] or 0,
-                        active_tasks=row["active_tasks"] or 0,
-                        completion_rate=row["completion_rate"] or 0.0,
-                        average_task_age=row["average_task_age"] or 0.0,
-                        last_activity_at=row["last_activity_at"],
-                        goal_created_at=row["goal_created_at"]
-                    )
-                    goals.append(goal)
+            # Bulk-validate the rows in one pass through pydantic-core
+            goals = GOAL_PROGRESS_LIST_ADAPTER.validate_python(result.data or [])
 
             total_goals = len(goals)
             avg_completion_rate = sum(g.completion_rate for g in goals) / total_goals if total_goals > 0 else 0.0
@@ -147,29 +378,37 @@ class AnalyticsService:
             logger.error(f"Failed to get goal progress for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve goal progress analytics")
 
+    @_cached_analytics
     async def get_quadrant_distribution(self, user_id: str) -> QuadrantDistribution:
         """Get task quadrant distribution"""
         try:
             validate_user_id(user_id)
 
             # Query quadrant_distribution view
-            result = self.db.table("quadrant_distribution").select("*").eq("user_id", user_id).execute()
+            result = await self._execute(
+                self.db.table("quadrant_distribution").select(QUADRANT_DISTRIBUTION_COLUMNS).eq("user_id", user_id)
+            )
 
             if result.data:
                 row = result.data[0]
+                total = row["total_active_tasks"] or 0
+                counts = {
+                    quadrant: row[f"{quadrant}_count"] or 0
+                    for quadrant in ("q1", "q2", "q3", "q4", "staging")
+                }
+                # The view only stores the counts; the percentages are
+                # computed here (same ROUND(..., 2) the SQL views use for
+                # q2_focus_percentage) instead of selecting columns the view
+                # never defined
                 return QuadrantDistribution(
                     user_id=row["user_id"],
-                    q1_count=row["q1_count"] or 0,
-                    q2_count=row["q2_count"] or 0,
-                    q3_count=row["q3_count"] or 0,
-                    q4_count=row["q4_count"] or 0,
-                    staging_count=row["staging_count"] or 0,
-                    total_active_tasks=row["total_active_tasks"] or 0,
-                    q1_percentage=row["q1_percentage"] or 0.0,
-                    q2_percentage=row["q2_percentage"] or 0.0,
-                    q3_percentage=row["q3_percentage"] or 0.0,
-                    q4_percentage=row["q4_percentage"] or 0.0,
-                    staging_percentage=row["staging_percentage"] or 0.0
+                    total_active_tasks=total,
+                    **{f"{quadrant}_count": count for quadrant, count in counts.items()},
+                    **{
+                        f"{quadrant}_percentage":
+                            round(count * 100.0 / total, 2) if total else 0.0
+                        for quadrant, count in counts.items()
+                    },
                 )
             else:
                 # Return empty distribution if no data
@@ -188,14 +427,14 @@ class AnalyticsService:
     async def get_productivity_trends(
         self,
         user_id: str,
-        date_range: DateRange
+        date_range: _DateRangeInternal
     ) -> List[ProductivityTrend]:
         """Get daily productivity trends"""
         try:
             validate_user_id(user_id)
 
             # Query productivity_trends view
-            query = self.db.table("productivity_trends").select("*").eq("user_id", user_id)
+            query = self.db.table("productivity_trends").select(PRODUCTIVITY_TRENDS_COLUMNS).eq("user_id", user_id)
             
             if date_range.start_date:
                 query = query.gte("trend_date", date_range.start_date.isoformat())
@@ -203,149 +442,115 @@ class AnalyticsService:
                 query = query.lte("trend_date", date_range.end_date.isoformat())
 
             query = query.order("trend_date", desc=False)
-            result = query.execute()
+            result = await self._execute(query)
 
-            trends = []
-            if result.data:
-                for row in result.data:
-                    trend = ProductivityTrend(
-                        date=row["trend_date"],
-                        tasks_completed=row["tasks_completed"] or 0,
-                        tasks_created=row["tasks_created"] or 0,
-                        goals_created=row["goals_created"] or 0,
-                        total_active_tasks=row["total_active_tasks"] or 0
-                    )
-                    trends.append(trend)
-
-            return trends
+            return TREND_LIST_ADAPTER.validate_python(result.data or [])
 
         except Exception as e:
             logger.error(f"Failed to get productivity trends for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve productivity trends")
 
+    async def iter_productivity_trends(
+        self,
+        user_id: str,
+        date_range: _DateRangeInternal
+    ) -> AsyncIterator[ProductivityTrend]:
+        """Yield daily productivity trends one row at a time
+
+        The rows come back from Supabase in a single query (the client does
+        not expose a server-side cursor), but yielding them individually lets
+        routes stream NDJSON without building the whole payload up front.
+        """
+        for trend in await self.get_productivity_trends(user_id, date_range):
+            yield trend
+
+    @_cached_analytics
     async def get_timeframe_analysis(self, user_id: str) -> List[TimeframeSummary]:
         """Get analysis by goal timeframe"""
         try:
             validate_user_id(user_id)
 
             # Query timeframe_analysis view
-            result = self.db.table("timeframe_analysis").select("*").eq("user_id", user_id).execute()
+            result = await self._execute(
+                self.db.table("timeframe_analysis").select(TIMEFRAME_ANALYSIS_COLUMNS).eq("user_id", user_id)
+            )
 
-            summaries = []
-            if result.data:
-                for row in result.data:
-                    summary = TimeframeSummary(
-                        timeframe=row["timeframe"],
-                        total_goals=row["total_goals"] or 0,
-                        active_goals=row["active_goals"] or 0,
-                        completed_goals=row["completed_goals"] or 0,
-                        total_tasks=row["total_tasks"] or 0,
-                        completed_tasks=row["completed_tasks"] or 0,
-                        average_completion_rate=row["average_completion_rate"] or 0.0
-                    )
-                    summaries.append(summary)
-
-            return summaries
+            return TIMEFRAME_LIST_ADAPTER.validate_python(result.data or [])
 
         except Exception as e:
             logger.error(f"Failed to get timeframe analysis for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve timeframe analysis")
 
+    @_cached_analytics
     async def get_category_analysis(self, user_id: str) -> List[CategorySummary]:
         """Get analysis by goal category"""
         try:
             validate_user_id(user_id)
 
             # Query category_analysis view
-            result = self.db.table("category_analysis").select("*").eq("user_id", user_id).execute()
+            result = await self._execute(
+                self.db.table("category_analysis").select(CATEGORY_ANALYSIS_COLUMNS).eq("user_id", user_id)
+            )
 
-            summaries = []
-            if result.data:
-                for row in result.data:
-                    summary = CategorySummary(
-                        category=row["category"],
-                        total_goals=row["total_goals"] or 0,
-                        active_goals=row["active_goals"] or 0,
-                        completed_goals=row["completed_goals"] or 0,
-                        total_tasks=row["total_tasks"] or 0,
-                        completed_tasks=row["completed_tasks"] or 0,
-                        average_completion_rate=row["average_completion_rate"] or 0.0
-                    )
-                    summaries.append(summary)
-
-            return summaries
+            return CATEGORY_LIST_ADAPTER.validate_python(result.data or [])
 
         except Exception as e:
             logger.error(f"Failed to get category analysis for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve category analysis")
 
+    @_cached_analytics
     async def get_priority_analysis(self, user_id: str) -> List[PriorityAnalysis]:
         """Get analysis by task priority"""
         try:
             validate_user_id(user_id)
 
             # Query priority_analysis view
-            result = self.db.table("priority_analysis").select("*").eq("user_id", user_id).execute()
+            result = await self._execute(
+                self.db.table("priority_analysis").select(PRIORITY_ANALYSIS_COLUMNS).eq("user_id", user_id)
+            )
 
-            analyses = []
-            if result.data:
-                for row in result.data:
-                    analysis = PriorityAnalysis(
-                        priority=row["priority"],
-                        total_tasks=row["total_tasks"] or 0,
-                        completed_tasks=row["completed_tasks"] or 0,
-                        overdue_tasks=row["overdue_tasks"] or 0,
-                        completion_rate=row["completion_rate"] or 0.0,
-                        average_completion_time=row["average_completion_time"]
-                    )
-                    analyses.append(analysis)
-
-            return analyses
+            return PRIORITY_LIST_ADAPTER.validate_python(result.data or [])
 
         except Exception as e:
             logger.error(f"Failed to get priority analysis for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve priority analysis")
 
+    @_cached_analytics
     async def get_overdue_analysis(self, user_id: str) -> OverdueAnalysis:
         """Get overdue tasks analysis"""
         try:
             validate_user_id(user_id)
 
             # Get overdue tasks by calling the database function
-            result = self.db.rpc("get_overdue_analysis", {"p_user_id": user_id}).execute()
+            result = await self._execute(self.db.rpc("get_overdue_analysis", {"p_user_id": user_id}))
 
             if result.data:
                 data = result.data[0]
                 return OverdueAnalysis(
                     total_overdue=data["total_overdue"] or 0,
-                    overdue_by_quadrant=data["overdue_by_quadrant"] or {},
-                    overdue_by_priority=data["overdue_by_priority"] or {},
-                    overdue_by_days=data["overdue_by_days"] or {},
+                    overdue_by_quadrant=OverdueByQuadrant.model_validate(data["overdue_by_quadrant"] or {}),
+                    overdue_by_priority=OverdueByPriority.model_validate(data["overdue_by_priority"] or {}),
+                    overdue_by_days=OverdueByDays.model_validate(data["overdue_by_days"] or {}),
                     oldest_overdue_task=data["oldest_overdue_task"]
                 )
             else:
-                return OverdueAnalysis(
-                    total_overdue=0,
-                    overdue_by_quadrant={},
-                    overdue_by_priority={},
-                    overdue_by_days={},
-                    oldest_overdue_task=None
-                )
+                return OverdueAnalysis()
 
         except Exception as e:
             logger.error(f"Failed to get overdue analysis for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve overdue analysis")
 
+    @_cached_analytics
     async def get_completion_velocity(self, user_id: str, period: str) -> CompletionVelocity:
         """Get task completion velocity"""
         try:
             validate_user_id(user_id)
 
             # Call database function to get completion velocity
-            result = self.db.rpc("get_completion_velocity", {
+            result = await self._execute(self.db.rpc("get_completion_velocity", {
                 "p_user_id": user_id,
                 "p_period": period
-            }).execute()
+            }))
 
             if result.data:
                 data = result.data[0]
@@ -369,13 +574,14 @@ class AnalyticsService:
             logger.error(f"Failed to get completion velocity for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve completion velocity")
 
+    @_cached_analytics
     async def get_staging_analytics(self, user_id: str) -> StagingZoneAnalytics:
         """Get staging zone analytics"""
         try:
             validate_user_id(user_id)
 
             # Call database function to get staging analytics
-            result = self.db.rpc("get_staging_analytics", {"p_user_id": user_id}).execute()
+            result = await self._execute(self.db.rpc("get_staging_analytics", {"p_user_id": user_id}))
 
             if result.data:
                 data = result.data[0]
@@ -399,13 +605,14 @@ class AnalyticsService:
             logger.error(f"Failed to get staging analytics for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve staging analytics")
 
+    @_cached_analytics
     async def calculate_productivity_score(self, user_id: str) -> UserProductivityScore:
         """Calculate user productivity score"""
         try:
             validate_user_id(user_id)
 
             # Call database function to calculate productivity score
-            result = self.db.rpc("calculate_productivity_score", {"p_user_id": user_id}).execute()
+            result = await self._execute(self.db.rpc("calculate_productivity_score", {"p_user_id": user_id}))
 
             if result.data:
                 data = result.data[0]
@@ -428,13 +635,18 @@ class AnalyticsService:
                     consistency_score=0.0,
                     staging_efficiency_score=0.0,
                     score_trend="stable",
-                    recommendations=["Create your first goal to start tracking productivity"]
+                    recommendations=list(_EMPTY_SCORE_RECOMMENDATIONS)
                 )
 
         except Exception as e:
             logger.error(f"Failed to calculate productivity score for user {user_id}: {e}")
             raise DatabaseError("Failed to calculate productivity score")
 
+    @redis_cached(
+        QuadrantAnalysisResponse,
+        ttl=300,
+        key_fn=_quadrant_analysis_cache_key
+    )
     async def get_quadrant_analysis(self, user_id: str) -> QuadrantAnalysisResponse:
         """Get detailed quadrant analysis with recommendations"""
         try:
@@ -443,57 +655,69 @@ class AnalyticsService:
             # Get current distribution
             distribution = await self.get_quadrant_distribution(user_id)
 
-            # Generate recommendations based on distribution
-            recommendations = []
-            ideal_distribution = {
-                "Q1": 20.0,  # Urgent + Important should be minimal
-                "Q2": 60.0,  # Important but not urgent should be majority
-                "Q3": 15.0,  # Urgent but not important should be limited
-                "Q4": 5.0,   # Neither should be minimal
-                "staging": 0.0  # Staging should be temporary
-            }
+            # Recommendations are computed next to the data by the
+            # get_quadrant_recommendations function; the Python cascade below
+            # remains as a fallback for a not-yet-migrated database
+            recommendations = None
+            try:
+                result = await self._execute(
+                    self.db.rpc("get_quadrant_recommendations", {"user_id_param": user_id})
+                )
+                if isinstance(result.data, list):
+                    recommendations = result.data
+            except Exception as e:
+                logger.debug(f"get_quadrant_recommendations RPC unavailable: {e}")
 
-            # Analyze current vs ideal distribution
-            if distribution.q1_percentage > 30:
-                recommendations.append("You have too many urgent+important tasks. Focus on prevention and planning.")
-            
-            if distribution.q2_percentage < 40:
-                recommendations.append("Increase focus on important but not urgent tasks (Q2) for better long-term results.")
-            
-            if distribution.q3_percentage > 25:
-                recommendations.append("Too many urgent but unimportant tasks. Consider delegation or elimination.")
-            
-            if distribution.q4_percentage > 10:
-                recommendations.append("Reduce time-wasting activities in Q4. Focus energy elsewhere.")
-            
-            if distribution.staging_percentage > 20:
-                recommendations.append("High staging utilization. Process staged items into appropriate quadrants.")
+            if recommendations is None:
+                recommendations = []
+
+                if distribution.q1_percentage > 30:
+                    recommendations.append("You have too many urgent+important tasks. Focus on prevention and planning.")
 
-            if not recommendations:
-                recommendations.append("Great quadrant balance! Maintain this distribution for optimal productivity.")
+                if distribution.q2_percentage < 40:
+                    recommendations.append("Increase focus on important but not urgent tasks (Q2) for better long-term results.")
+
+                if distribution.q3_percentage > 25:
+                    recommendations.append("Too many urgent but unimportant tasks. Consider delegation or elimination.")
+
+                if distribution.q4_percentage > 10:
+                    recommendations.append("Reduce time-wasting activities in Q4. Focus energy elsewhere.")
+
+                if distribution.staging_percentage > 20:
+                    recommendations.append("High staging utilization. Process staged items into appropriate quadrants.")
+
+                if not recommendations:
+                    recommendations.append("Great quadrant balance! Maintain this distribution for optimal productivity.")
 
             return QuadrantAnalysisResponse(
                 distribution=distribution,
                 recommendations=recommendations,
-                ideal_distribution=ideal_distribution
+                ideal_distribution=IDEAL_QUADRANT_DISTRIBUTION
             )
 
         except Exception as e:
             logger.error(f"Failed to get quadrant analysis for user {user_id}: {e}")
             raise DatabaseError("Failed to retrieve quadrant analysis")
 
+    @redis_cached(
+        ProductivityInsightsResponse,
+        ttl=300,
+        key_fn=_insights_cache_key
+    )
     async def get_productivity_insights(self, user_id: str) -> ProductivityInsightsResponse:
         """Get comprehensive productivity insights"""
         try:
             validate_user_id(user_id)
 
-            # Get components
-            productivity_score = await self.calculate_productivity_score(user_id)
-            trends = await self.get_productivity_trends(
-                user_id, 
-                DateRange(start_date=date.today() - timedelta(days=30), end_date=date.today())
+            # Get the independent components concurrently
+            productivity_score, trends, velocity = await asyncio.gather(
+                self.calculate_productivity_score(user_id),
+                self.get_productivity_trends(
+                    user_id,
+                    _DateRangeInternal(date.today() - timedelta(days=30), date.today())
+                ),
+                self.get_completion_velocity(user_id, "30_days")
             )
-            velocity = await self.get_completion_velocity(user_id, "30_days")
 
             # Generate insights
             insights = []
@@ -508,11 +732,20 @@ class AnalyticsService:
                 insights.append("Productivity below optimal. Focus on key improvement areas.")
                 action_items.append("Review and optimize your goal-setting process")
 
-            # Analyze trends
+            # Analyze trends: accumulate the first and last 7 days in a
+            # single walk instead of slicing the list twice
             if len(trends) >= 7:
-                recent_avg = sum(t.tasks_completed for t in trends[-7:]) / 7
-                earlier_avg = sum(t.tasks_completed for t in trends[:7]) / 7 if len(trends) >= 14 else recent_avg
-                
+                recent_start = len(trends) - 7
+                recent_sum = earlier_sum = 0
+                for i, t in enumerate(trends):
+                    if i < 7:
+                        earlier_sum += t.tasks_completed
+                    if i >= recent_start:
+                        recent_sum += t.tasks_completed
+                recent_avg = recent_sum / 7
+                earlier_avg = earlier_sum / 7 if len(trends) >= 14 else recent_avg
+
+
                 if recent_avg > earlier_avg * 1.1:
                     insights.append("Your task completion rate is trending upward!")
                 elif recent_avg < earlier_avg * 0.9:
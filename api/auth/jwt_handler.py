@@ -2,26 +2,151 @@
 JWT Token Handler for Google OAuth Integration
 """
 
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+
+import httpx
 import jwt
+import orjson
 import logging
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from cachetools import TTLCache
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from api.shared.exceptions import UnauthorizedError
 
 logger = logging.getLogger(__name__)
 
+# Verified-token cache: the same Bearer token is reused for its whole
+# lifetime, so re-decoding it on every request is redundant CPU on the
+# hottest path in the API. Keys are token digests (never the raw token) and
+# only successfully validated tokens are stored; entries are re-checked
+# against the token's own exp before being served. Accessed only from the
+# event loop thread, so no locking is required.
+_TOKEN_CACHE_TTL = 300
+
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=_TOKEN_CACHE_TTL)
+
+# Google's JWKS endpoint and cache tuning. Keys are cached in-process and
+# refreshed at most once a minute, so unknown-kid tokens cannot be used to
+# hammer Google's endpoint.
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+_JWKS_MIN_TTL = 600
+_JWKS_REFETCH_INTERVAL = 60
+
+# Claims every Google OAuth token must carry
+_REQUIRED_JWT_FIELDS = frozenset({'iss', 'aud', 'sub', 'exp', 'iat'})
+
+# Google issues ID tokens under either issuer form
+_GOOGLE_ISSUERS = frozenset({'accounts.google.com', 'https://accounts.google.com'})
+
+# Shared HTTP client for JWKS fetches. One keep-alive client amortizes DNS,
+# TCP and TLS setup across refreshes instead of rebuilding the pool per call.
+# Created lazily so importing this module never opens sockets; closed from
+# the app shutdown hook.
+_jwks_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_jwks_http_client() -> httpx.AsyncClient:
+    """Get or create the shared JWKS HTTP client"""
+    global _jwks_http_client
+    if _jwks_http_client is None:
+        _jwks_http_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _jwks_http_client
+
+
+async def close_jwks_http_client() -> None:
+    """Close the shared JWKS HTTP client (called on app shutdown)"""
+    global _jwks_http_client
+    if _jwks_http_client is not None:
+        await _jwks_http_client.aclose()
+        _jwks_http_client = None
+
 
 class JWTTokenHandler:
     """Handle JWT token validation and user extraction for Google OAuth"""
     
     def __init__(self):
-        # Google's public keys for JWT verification
-        # In production, these should be fetched from Google's JWKS endpoint
-        self.google_public_keys = {
-            # This is a placeholder - in production, fetch from:
-            # https://www.googleapis.com/oauth2/v3/certs
-        }
+        # Google's public keys for JWT verification, cached by kid and
+        # lazily fetched from the JWKS endpoint when signature verification
+        # is enabled via VERIFY_JWT_SIGNATURES
+        self.verify_signatures = os.getenv("VERIFY_JWT_SIGNATURES", "false").lower() == "true"
+        # Expected audience for verified tokens: Google sets aud to the OAuth
+        # client id, and PyJWT rejects any token carrying an aud claim unless
+        # the expected value is supplied (every Google ID token carries one)
+        self.expected_audience = os.getenv("GOOGLE_CLIENT_ID")
+        if self.verify_signatures and not self.expected_audience:
+            logger.warning(
+                "VERIFY_JWT_SIGNATURES is enabled without GOOGLE_CLIENT_ID; "
+                "tokens will be accepted for any audience"
+            )
+        self.google_public_keys: Dict[str, Any] = {}
+        self._jwks_expiry: float = 0.0
+        self._jwks_last_fetch: float = 0.0
+        self._jwks_etag: Optional[str] = None
+        self._jwks_lock = asyncio.Lock()
+
+    async def _get_signing_key(self, kid: Optional[str]) -> Optional[Any]:
+        """Get the cached public key for a kid, refreshing the JWKS if needed
+
+        The refresh honours Cache-Control: max-age from Google (with a floor)
+        and is rate-limited so a flood of unknown-kid tokens cannot turn into
+        a flood of JWKS fetches.
+        """
+        key = self.google_public_keys.get(kid)
+        if key is not None and time.time() < self._jwks_expiry:
+            return key
+
+        async with self._jwks_lock:
+            # Another request may have refreshed while we waited on the lock
+            key = self.google_public_keys.get(kid)
+            if key is not None and time.time() < self._jwks_expiry:
+                return key
+            if time.time() - self._jwks_last_fetch >= _JWKS_REFETCH_INTERVAL:
+                await self._refresh_jwks()
+
+        return self.google_public_keys.get(kid)
+
+    async def _refresh_jwks(self) -> None:
+        """Fetch Google's JWKS and rebuild the kid -> public key cache"""
+        self._jwks_last_fetch = time.time()
+
+        headers = {"Accept": "application/json"}
+        if self._jwks_etag:
+            headers["If-None-Match"] = self._jwks_etag
+        response = await _get_jwks_http_client().get(GOOGLE_JWKS_URL, headers=headers)
+
+        max_age = _JWKS_MIN_TTL
+        match = re.search(r"max-age=(\d+)", response.headers.get("cache-control", ""))
+        if match:
+            max_age = max(int(match.group(1)), _JWKS_MIN_TTL)
+
+        if response.status_code == 304:
+            # Key set unchanged; keep the parsed keys and extend their expiry
+            self._jwks_expiry = time.time() + max_age
+            return
+
+        response.raise_for_status()
+        self._jwks_etag = response.headers.get("etag")
+
+        keys: Dict[str, Any] = {}
+        for jwk in response.json().get("keys", []):
+            kid = jwk.get("kid")
+            if kid:
+                keys[kid] = jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(jwk))
+
+        self.google_public_keys = keys
+        self._jwks_expiry = time.time() + max_age
+        logger.info("Refreshed Google JWKS cache with %d keys", len(keys))
+
     
     async def verify_google_token(self, token: str) -> Dict[str, Any]:
         """
@@ -36,15 +161,32 @@ class JWTTokenHandler:
         Raises:
             UnauthorizedError: If token is invalid or expired
         """
+        token_key = hashlib.sha256(token.encode()).hexdigest()[:32]
+        cached = _token_cache.get(token_key)
+        if cached is not None and cached['token_expires_at'] > time.time():
+            return cached
+
         try:
-            # For development, we'll decode without verification
-            # In production, you should verify the signature with Google's public keys
-            decoded_token = jwt.decode(
-                token, 
-                options={"verify_signature": False},  # Skip signature verification for now
-                algorithms=["RS256"]
-            )
-            
+            if self.verify_signatures:
+                header = jwt.get_unverified_header(token)
+                key = await self._get_signing_key(header.get('kid'))
+                if key is None:
+                    raise UnauthorizedError("Unknown token signing key")
+                # RSA signature verification is CPU-heavy; running it on the
+                # threadpool keeps concurrent requests from serializing
+                # behind each other on the event loop. Cache hits above never
+                # reach this point.
+                decoded_token = await run_in_threadpool(self._verify_sync, token, key)
+            else:
+                # For development, we decode without verification, so the
+                # full PyJWT machinery (algorithm whitelist, options
+                # handling, claims validation) is skipped in favour of
+                # decoding just the payload segment.
+                _, payload_b64, _ = token.split('.', 2)
+                padding = '=' * (-len(payload_b64) % 4)
+                decoded_token = orjson.loads(base64.urlsafe_b64decode(payload_b64 + padding))
+
+
             # Validate token structure
             if not self._validate_token_structure(decoded_token):
                 raise UnauthorizedError("Invalid token structure")
@@ -55,21 +197,47 @@ class JWTTokenHandler:
             
             # Extract user information
             user_info = self._extract_user_info(decoded_token)
-            
-            logger.info(f"Successfully verified token for user: {user_info.get('user_id')}")
+
+            # Cache only successful validations; expired entries are rejected
+            # by the exp check above even if still within the cache TTL
+            _token_cache[token_key] = user_info
+
+            logger.info("Successfully verified token for user: %s", user_info['user_id'])
             return user_info
             
-        except jwt.InvalidTokenError as e:
-            logger.warning(f"Invalid JWT token: {e}")
+        except (ValueError, jwt.InvalidTokenError) as e:
+            # ValueError covers malformed segments, base64 and JSON errors
+            logger.warning("Invalid JWT token: %s", e)
             raise UnauthorizedError("Invalid token format")
         except Exception as e:
-            logger.error(f"Token verification failed: {e}")
+            logger.error("Token verification failed: %s", e)
             raise UnauthorizedError("Token verification failed")
     
+    def _verify_sync(self, token: str, key: Any) -> Dict[str, Any]:
+        """Decode a token with full signature verification (blocking)
+
+        Runs on the threadpool via verify_google_token with a signing key
+        resolved from the JWKS cache. The audience must match the configured
+        Google client id; the issuer is checked against both forms Google
+        uses (PyJWT's issuer= takes a single value, so the set membership
+        test lives here).
+        """
+        decoded_token = jwt.decode(
+            token,
+            key=key,
+            algorithms=["RS256"],
+            audience=self.expected_audience,
+            options={"verify_aud": self.expected_audience is not None},
+        )
+        if decoded_token.get('iss') not in _GOOGLE_ISSUERS:
+            raise jwt.InvalidIssuerError("Token issuer is not Google")
+        return decoded_token
+
     def _validate_token_structure(self, decoded_token: Dict[str, Any]) -> bool:
         """Validate that the token has required Google OAuth fields"""
-        required_fields = ['iss', 'aud', 'sub', 'exp', 'iat']
-        return all(field in decoded_token for field in required_fields)
+        # dict.keys() is set-like, so the subset test runs as one C-level
+        # set operation instead of a per-field generator
+        return _REQUIRED_JWT_FIELDS <= decoded_token.keys()
     
     def _is_token_expired(self, decoded_token: Dict[str, Any]) -> bool:
         """Check if the token has expired"""
@@ -77,8 +245,9 @@ class JWTTokenHandler:
         if not exp_timestamp:
             return True
         
-        current_time = datetime.utcnow().timestamp()
-        return current_time > exp_timestamp
+        # time.time() already returns float epoch seconds; building a datetime
+        # just to convert it back is wasted allocation on the uncached path
+        return time.time() > exp_timestamp
     
     def _extract_user_info(self, decoded_token: Dict[str, Any]) -> Dict[str, Any]:
         """Extract user information from the decoded token"""
@@ -105,18 +274,11 @@ class JWTTokenHandler:
 jwt_handler = JWTTokenHandler()
 
 
-async def get_current_user_from_token(authorization: str) -> str:
-    """
-    Extract user ID from Authorization Bearer token
-    
-    Args:
-        authorization: Authorization header value (e.g., "Bearer <token>")
-        
-    Returns:
-        User ID from the token
-        
-    Raises:
-        HTTPException: If token is invalid or missing
+def _extract_bearer_token(authorization: str) -> str:
+    """Extract the token from a "Bearer <token>" Authorization header
+
+    Shared by both token dependencies below; a fixed-length prefix check
+    replaces the old split + full lower() pass that each of them duplicated.
     """
     if not authorization:
         raise HTTPException(
@@ -124,23 +286,32 @@ async def get_current_user_from_token(authorization: str) -> str:
             detail="Authorization header is required",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    # Extract token from "Bearer <token>" format
-    try:
-        scheme, token = authorization.split(' ', 1)
-        if scheme.lower() != 'bearer':
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication scheme. Use 'Bearer'",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except ValueError:
+
+    if len(authorization) < 8 or authorization[:7].lower() != 'bearer ':
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization header format. Use 'Bearer <token>'",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    return authorization[7:].strip()
+
+
+async def get_current_user_from_token(authorization: str) -> str:
+    """
+    Extract user ID from Authorization Bearer token
     
+    Args:
+        authorization: Authorization header value (e.g., "Bearer <token>")
+        
+    Returns:
+        User ID from the token
+        
+    Raises:
+        HTTPException: If token is invalid or missing
+    """
+    token = _extract_bearer_token(authorization)
+
     try:
         # Verify token and extract user info
         user_info = await jwt_handler.verify_google_token(token)
@@ -167,29 +338,8 @@ async def get_current_user_info(authorization: str) -> Dict[str, Any]:
     Raises:
         HTTPException: If token is invalid or missing
     """
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header is required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    # Extract token from "Bearer <token>" format
-    try:
-        scheme, token = authorization.split(' ', 1)
-        if scheme.lower() != 'bearer':
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication scheme. Use 'Bearer'",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format. Use 'Bearer <token>'",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+    token = _extract_bearer_token(authorization)
+
     try:
         # Verify token and extract user info
         user_info = await jwt_handler.verify_google_token(token)
@@ -2,28 +2,125 @@
 FastAPI dependencies for the Quadrant Planner API
 """
 
-from typing import Optional, Tuple
-from fastapi import Depends, Query, Header, HTTPException
-from supabase import Client
-from database.connection import get_supabase_client, db_manager
+import asyncio
+import hashlib
+from typing import Annotated, Dict, Optional, Tuple
+from cachetools import TTLCache
+from fastapi import Depends, Query, Header, HTTPException, Request, Response
+from supabase import Client, AsyncClient
+from database.connection import get_supabase_client, get_service_client, get_async_service_client, db_manager
 from api.shared.exceptions import ValidationError, UnauthorizedError
-from api.shared.validation import validate_user_id, validate_pagination
+from api.shared.validation import validate_user_id
 from api.auth.jwt_handler import get_current_user_from_token, get_current_user_info
 
+# Reusable pagination parameter types. The ge/le bounds are enforced by
+# pydantic-core during query parsing, so no Python-level range check or
+# custom ValidationError translation runs per request; out-of-range values
+# get FastAPI's standard 422, same as before.
+PageLimit = Annotated[int, Query(ge=1, le=200, description="Number of items to return")]
+PageOffset = Annotated[int, Query(ge=0, description="Number of items to skip")]
 
-def get_db() -> Client:
+# Allowed filter values and their rejection messages, built once at import
+# time so per-request validation is a frozenset membership test instead of
+# rebuilding a list and formatting a message on every call
+_ALLOWED_CATEGORIES = frozenset({'career', 'health', 'relationships', 'learning', 'financial', 'personal'})
+_ALLOWED_CATEGORIES_MSG = "Invalid category. Must be one of: " + ", ".join(sorted(_ALLOWED_CATEGORIES))
+
+_ALLOWED_TIMEFRAMES = frozenset({'3_months', '6_months', '1_year', 'ongoing'})
+_ALLOWED_TIMEFRAMES_MSG = "Invalid timeframe. Must be one of: " + ", ".join(sorted(_ALLOWED_TIMEFRAMES))
+
+_ALLOWED_QUADRANTS = frozenset({'Q1', 'Q2', 'Q3', 'Q4', 'staging'})
+_ALLOWED_QUADRANTS_MSG = "Invalid quadrant. Must be one of: " + ", ".join(sorted(_ALLOWED_QUADRANTS))
+
+_ALLOWED_PRIORITIES = frozenset({'low', 'medium', 'high', 'urgent'})
+_ALLOWED_PRIORITIES_MSG = "Invalid priority. Must be one of: " + ", ".join(sorted(_ALLOWED_PRIORITIES))
+
+_ALLOWED_PERIODS = frozenset({'week', 'month', 'quarter', 'year'})
+_ALLOWED_PERIODS_MSG = "Invalid period. Must be one of: " + ", ".join(sorted(_ALLOWED_PERIODS))
+
+
+async def get_db() -> Client:
     """Dependency to get database client"""
     return get_supabase_client()
 
 
-def get_user_id_from_query(user_id: str = Query(..., description="User identifier")) -> str:
+# Shared AnalyticsService instances, keyed by the Supabase client they wrap
+_analytics_services: Dict[int, "AnalyticsService"] = {}
+
+
+async def get_analytics_service(db: Client = Depends(get_db)) -> "AnalyticsService":
+    """Dependency to get a shared AnalyticsService for the database client"""
+    # Imported lazily to keep analytics optional at app startup
+    from api.analytics.service import AnalyticsService
+
+    service = _analytics_services.get(id(db))
+    if service is None:
+        service = AnalyticsService(db)
+        _analytics_services[id(db)] = service
+    return service
+
+
+async def get_user_id_from_query(user_id: str = Query(..., description="User identifier")) -> str:
     """Extract and validate user ID from query parameters (DEPRECATED - use JWT auth)"""
     return validate_user_id(user_id)
 
 
+# Per-user analytics content versions, refreshed at most every 5 seconds
+_analytics_etags: TTLCache = TTLCache(maxsize=10000, ttl=5)
+
+
+async def get_analytics_etag(
+    request: Request,
+    response: Response,
+    user_id: str = Depends(get_user_id_from_query),
+    db: Client = Depends(get_db)
+) -> str:
+    """Short-circuit analytics GETs with a 304 when the client is up to date
+
+    The ETag is derived from the latest task and goal updates for the user -
+    two cheap indexed queries compared to regenerating a full analytics
+    payload. Handlers return Response objects directly, which bypasses
+    FastAPI's sub-response header merge, so they attach the returned etag to
+    their own response (e.g. via success_response(headers=...)).
+    """
+    etag = _analytics_etags.get(user_id)
+    if etag is None:
+        def _latest_update(table: str) -> str:
+            query = (
+                db.table(table)
+                .select("updated_at")
+                .eq("user_id", user_id)
+                .order("updated_at", desc=True)
+                .limit(1)
+            )
+            result = query.execute()
+            return result.data[0]["updated_at"] if result.data else "empty"
+
+        # Goal-derived analytics must see goal-only mutations too, so the
+        # digest folds in both tables' latest update; the two indexed
+        # lookups run concurrently
+        latest_task, latest_goal = await asyncio.gather(
+            asyncio.to_thread(_latest_update, "tasks"),
+            asyncio.to_thread(_latest_update, "goals"),
+        )
+        digest = hashlib.md5(f"{user_id}:{latest_task}:{latest_goal}".encode()).hexdigest()
+        etag = f'W/"{digest}"'
+        _analytics_etags[user_id] = etag
+
+    if request.headers.get("if-none-match") == etag:
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return etag
+
+
 async def get_user_id_from_token(authorization: str = Header(..., description="Authorization header with Bearer token")) -> str:
-    """Extract and validate user ID from JWT Bearer token"""
-    return await get_current_user_from_token(authorization)
+    """Extract and validate user ID from JWT Bearer token
+
+    Validation happens once here at the request boundary; service methods
+    receive the already-validated id and do not re-check it per call.
+    """
+    return validate_user_id(await get_current_user_from_token(authorization))
 
 
 async def get_user_info_from_token(authorization: str = Header(..., description="Authorization header with Bearer token")) -> dict:
@@ -31,22 +128,33 @@ async def get_user_info_from_token(authorization: str = Header(..., description=
     return await get_current_user_info(authorization)
 
 
-def get_user_id_from_header(user_id: Optional[str] = Header(None, alias="X-User-ID")) -> str:
+async def get_user_scoped_db(user_id: str = Depends(get_user_id_from_token)) -> AsyncClient:
+    """Async service client with the RLS user context already set for this request
+
+    Issues the set_current_user_id RPC exactly once per request, so service
+    methods can run their queries directly instead of each paying an extra
+    round-trip to re-establish the same context. FastAPI's per-request
+    dependency cache shares the resolved user id with the route itself. The
+    async client awaits its HTTP calls natively, so no to_thread hop is needed.
+    """
+    service_db = await get_async_service_client()
+    await service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
+    return service_db
+
+
+async def get_user_id_from_header(user_id: Optional[str] = Header(None, alias="X-User-ID")) -> str:
     """Extract and validate user ID from header"""
     if not user_id:
         raise UnauthorizedError("User ID header is required")
     return validate_user_id(user_id)
 
 
-def get_pagination_params(
-    limit: Optional[int] = Query(None, ge=1, le=200, description="Number of items to return"),
-    offset: Optional[int] = Query(None, ge=0, description="Number of items to skip")
-) -> Tuple[int, int]:
-    """Get and validate pagination parameters"""
-    return validate_pagination(limit, offset)
+async def get_pagination_params(limit: PageLimit = 50, offset: PageOffset = 0) -> Tuple[int, int]:
+    """Get pagination parameters, bounds-checked in pydantic-core"""
+    return limit, offset
 
 
-def get_goal_filters(
+async def get_goal_filters(
     category: Optional[str] = Query(None, description="Filter by goal category"),
     archived: Optional[bool] = Query(False, description="Include archived goals"),
     timeframe: Optional[str] = Query(None, description="Filter by goal timeframe")
@@ -55,22 +163,20 @@ def get_goal_filters(
     filters = {}
     
     if category:
-        allowed_categories = ['career', 'health', 'relationships', 'learning', 'financial', 'personal']
-        if category not in allowed_categories:
-            raise ValidationError(f"Invalid category. Must be one of: {', '.join(allowed_categories)}")
+        if category not in _ALLOWED_CATEGORIES:
+            raise ValidationError(_ALLOWED_CATEGORIES_MSG)
         filters['category'] = category
-    
+
     if timeframe:
-        allowed_timeframes = ['3_months', '6_months', '1_year', 'ongoing']
-        if timeframe not in allowed_timeframes:
-            raise ValidationError(f"Invalid timeframe. Must be one of: {', '.join(allowed_timeframes)}")
+        if timeframe not in _ALLOWED_TIMEFRAMES:
+            raise ValidationError(_ALLOWED_TIMEFRAMES_MSG)
         filters['timeframe'] = timeframe
     
     filters['archived'] = archived
     return filters
 
 
-def get_task_filters(
+async def get_task_filters(
     quadrant: Optional[str] = Query(None, description="Filter by task quadrant"),
     goal_id: Optional[str] = Query(None, description="Filter by goal ID"),
     completed: Optional[bool] = Query(None, description="Filter by completion status"),
@@ -82,9 +188,8 @@ def get_task_filters(
     filters = {}
     
     if quadrant:
-        allowed_quadrants = ['Q1', 'Q2', 'Q3', 'Q4', 'staging']
-        if quadrant not in allowed_quadrants:
-            raise ValidationError(f"Invalid quadrant. Must be one of: {', '.join(allowed_quadrants)}")
+        if quadrant not in _ALLOWED_QUADRANTS:
+            raise ValidationError(_ALLOWED_QUADRANTS_MSG)
         filters['quadrant'] = quadrant
     
     if goal_id:
@@ -97,9 +202,8 @@ def get_task_filters(
         filters['is_staged'] = is_staged
     
     if priority:
-        allowed_priorities = ['low', 'medium', 'high', 'urgent']
-        if priority not in allowed_priorities:
-            raise ValidationError(f"Invalid priority. Must be one of: {', '.join(allowed_priorities)}")
+        if priority not in _ALLOWED_PRIORITIES:
+            raise ValidationError(_ALLOWED_PRIORITIES_MSG)
         filters['priority'] = priority
     
     if tags:
@@ -109,15 +213,14 @@ def get_task_filters(
     return filters
 
 
-def get_analytics_params(
+async def get_analytics_params(
     period: Optional[str] = Query("week", description="Analytics period"),
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)")
 ) -> dict:
     """Get analytics filtering parameters"""
-    allowed_periods = ['week', 'month', 'quarter', 'year']
-    if period not in allowed_periods:
-        raise ValidationError(f"Invalid period. Must be one of: {', '.join(allowed_periods)}")
+    if period not in _ALLOWED_PERIODS:
+        raise ValidationError(_ALLOWED_PERIODS_MSG)
     
     params = {'period': period}
     
@@ -130,71 +233,58 @@ def get_analytics_params(
     return params
 
 
-def get_task_filters(
-    quadrant: Optional[str] = Query(None, description="Filter by task quadrant"),
-    goal_id: Optional[str] = Query(None, description="Filter by goal ID"),
-    completed: Optional[bool] = Query(None, description="Filter by completion status"),
-    is_staged: Optional[bool] = Query(None, description="Filter by staging status"),
-    priority: Optional[str] = Query(None, description="Filter by priority"),
-    tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)")
-) -> dict:
-    """Get task filtering parameters"""
-    filters = {}
-    
-    if quadrant:
-        allowed_quadrants = ['Q1', 'Q2', 'Q3', 'Q4', 'staging']
-        if quadrant not in allowed_quadrants:
-            raise ValidationError(f"Invalid quadrant. Must be one of: {', '.join(allowed_quadrants)}")
-        filters['quadrant'] = quadrant
-    
-    if goal_id:
-        filters['goal_id'] = goal_id
-    
-    if completed is not None:
-        filters['completed'] = completed
-    
-    if is_staged is not None:
-        filters['is_staged'] = is_staged
-    
-    if priority:
-        allowed_priorities = ['low', 'medium', 'high', 'urgent']
-        if priority not in allowed_priorities:
-            raise ValidationError(f"Invalid priority. Must be one of: {', '.join(allowed_priorities)}")
-        filters['priority'] = priority
-    
-    if tags:
-        # Convert comma-separated tags to list
-        filters['tags'] = [tag.strip() for tag in tags.split(',') if tag.strip()]
-    
-    return filters
+# Positive ownership results, keyed by (table, record id, user id). Ownership
+# never changes for existing records in this schema, so confirmed checks can
+# be served from memory and skip a PostgREST round-trip. Negative results are
+# never cached: a record created between checks must be visible immediately.
+_ownership_cache: TTLCache = TTLCache(maxsize=50000, ttl=30)
 
 
-async def verify_goal_ownership(goal_id: str, user_id: str, db: Client = Depends(get_db)) -> bool:
-    """Verify that a goal belongs to the user"""
+async def _verify_ownership(table: str, record_id: str, user_id: str, db: Client) -> bool:
+    """Check that a record in `table` belongs to the user, with caching"""
+    key = (table, record_id, user_id)
+    if _ownership_cache.get(key):
+        return True
+
     try:
-        result = db.table("goals").select("id").eq("id", goal_id).eq("user_id", user_id).execute()
-        return len(result.data) > 0
+        query = db.table(table).select("id").eq("id", record_id).eq("user_id", user_id)
+        result = await asyncio.to_thread(query.execute)
+        owned = len(result.data) > 0
+        if owned:
+            _ownership_cache[key] = True
+        return owned
     except Exception:
         return False
 
 
+async def verify_goal_ownership(goal_id: str, user_id: str, db: Client = Depends(get_db)) -> bool:
+    """Verify that a goal belongs to the user"""
+    return await _verify_ownership("goals", goal_id, user_id, db)
+
+
 async def verify_task_ownership(task_id: str, user_id: str, db: Client = Depends(get_db)) -> bool:
     """Verify that a task belongs to the user"""
-    try:
-        result = db.table("tasks").select("id").eq("id", task_id).eq("user_id", user_id).execute()
-        return len(result.data) > 0
-    except Exception:
-        return False
+    return await _verify_ownership("tasks", task_id, user_id, db)
+
+
+# Shared Depends(...) markers. Building these once at module level keeps the
+# dependency graph identical across every endpoint and class that uses them,
+# so FastAPI's per-request cache (keyed by callable identity) dedupes the
+# resolutions instead of treating each inline Depends(...) as separate work.
+_DbDep = Depends(get_db)
+_UserIdTokenDep = Depends(get_user_id_from_token)
+_UserIdQueryDep = Depends(get_user_id_from_query)
+_PaginationDep = Depends(get_pagination_params)
 
 
 class CommonDependencies:
     """Common dependencies for API endpoints"""
-    
+
     def __init__(
         self,
-        user_id: str = Depends(get_user_id_from_token),  # Use JWT auth by default
-        db: Client = Depends(get_db),
-        pagination: Tuple[int, int] = Depends(get_pagination_params)
+        user_id: str = _UserIdTokenDep,  # Use JWT auth by default
+        db: Client = _DbDep,
+        pagination: Tuple[int, int] = _PaginationDep
     ):
         self.user_id = user_id
         self.db = db
@@ -203,12 +293,12 @@ class CommonDependencies:
 
 class CommonDependenciesLegacy:
     """Legacy dependencies using query parameters (DEPRECATED)"""
-    
+
     def __init__(
         self,
-        user_id: str = Depends(get_user_id_from_query),
-        db: Client = Depends(get_db),
-        pagination: Tuple[int, int] = Depends(get_pagination_params)
+        user_id: str = _UserIdQueryDep,
+        db: Client = _DbDep,
+        pagination: Tuple[int, int] = _PaginationDep
     ):
         self.user_id = user_id
         self.db = db
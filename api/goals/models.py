@@ -3,14 +3,25 @@ Pydantic models for Goals API
 """
 
 from typing import Optional, List
+from dataclasses import dataclass
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from database.models import GoalCategory, GoalTimeframe
 from api.shared.validation import (
     validate_goal_title,
     validate_goal_description,
-    validate_color,
-    BaseValidator
+    validate_color
+)
+
+# Shared model configuration: v1-style inner Config classes force pydantic to
+# rebuild a config dict per class at import; one ConfigDict instance is reused
+# by every model here. from_attributes is harmless for request models and
+# required by the response models.
+GOAL_MODEL_CONFIG = ConfigDict(
+    populate_by_name=True,  # Accept both snake_case and camelCase
+    ser_json_by_alias=True,  # Serialize using aliases (camelCase) in responses
+    from_attributes=True,
+    json_schema_serialization_defaults_required=True,
 )
 
 
@@ -22,20 +33,20 @@ class GoalBase(BaseModel):
     timeframe: GoalTimeframe = Field(..., description="Goal timeframe")
     color: Optional[str] = Field(None, max_length=50, description="Goal color (hex or name)")
 
-    class Config:
-        populate_by_name = True  # Accept both snake_case and camelCase
-        json_schema_serialization_defaults_required = True
-        ser_json_by_alias = True  # Serialize using aliases (camelCase) in responses
+    model_config = GOAL_MODEL_CONFIG
 
-    @validator('title')
+    @field_validator('title')
+    @classmethod
     def validate_title(cls, v: str) -> str:
         return validate_goal_title(v)
 
-    @validator('description')
+    @field_validator('description')
+    @classmethod
     def validate_description(cls, v: Optional[str]) -> Optional[str]:
         return validate_goal_description(v)
 
-    @validator('color')
+    @field_validator('color')
+    @classmethod
     def validate_color_format(cls, v: Optional[str]) -> Optional[str]:
         return validate_color(v)
 
@@ -46,8 +57,11 @@ class GoalCreate(GoalBase):
 
 
 class GoalUpdate(BaseModel):
-    """Goal update model - all fields optional"""
-    user_id: str = Field(..., alias="userId", min_length=1, max_length=255, description="User identifier")
+    """Goal update model - all fields optional
+
+    The acting user comes from the JWT dependency, not the payload, so there
+    is no user_id field to validate or cross-check against the token.
+    """
     title: Optional[str] = Field(None, min_length=1, max_length=200, description="Goal title")
     description: Optional[str] = Field(None, max_length=1000, description="Goal description")
     category: Optional[GoalCategory] = Field(None, description="Goal category")
@@ -55,26 +69,22 @@ class GoalUpdate(BaseModel):
     color: Optional[str] = Field(None, max_length=50, description="Goal color")
     archived: Optional[bool] = Field(None, description="Archive status")
 
-    class Config:
-        populate_by_name = True  # Accept both snake_case and camelCase
-        json_schema_serialization_defaults_required = True
-        ser_json_by_alias = True  # Serialize using aliases (camelCase) in responses
+    model_config = GOAL_MODEL_CONFIG
 
-    @validator('user_id')
-    def validate_user_id(cls, v: str) -> str:
-        return BaseValidator.validate_required_string(v, "User ID", 255)
-
-    @validator('title')
+    @field_validator('title')
+    @classmethod
     def validate_title(cls, v: Optional[str]) -> Optional[str]:
         if v is not None:
             return validate_goal_title(v)
         return v
 
-    @validator('description')
+    @field_validator('description')
+    @classmethod
     def validate_description(cls, v: Optional[str]) -> Optional[str]:
         return validate_goal_description(v)
 
-    @validator('color')
+    @field_validator('color')
+    @classmethod
     def validate_color_format(cls, v: Optional[str]) -> Optional[str]:
         return validate_color(v)
 
@@ -87,11 +97,7 @@ class Goal(GoalBase):
     created_at: datetime = Field(..., alias="createdAt", description="Creation timestamp")
     updated_at: datetime = Field(..., alias="updatedAt", description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True  # Accept both snake_case and camelCase
-        json_schema_serialization_defaults_required = True
-        ser_json_by_alias = True  # Serialize using aliases (camelCase) in responses
+    model_config = GOAL_MODEL_CONFIG
 
 
 class GoalWithStats(Goal):
@@ -113,18 +119,22 @@ class GoalStats(BaseModel):
     average_task_age: Optional[float] = Field(default=None, alias="averageTaskAge", ge=0, description="Average age of active tasks in days")
     last_activity_at: Optional[datetime] = Field(default=None, alias="lastActivityAt", description="Last activity timestamp")
 
-    class Config:
-        populate_by_name = True
-        json_schema_serialization_defaults_required = True
-        ser_json_by_alias = True
+    model_config = GOAL_MODEL_CONFIG
+
 
+@dataclass(slots=True, frozen=True)
+class TaskSummary:
+    """Summary of a task for goal details
 
-class TaskSummary(BaseModel):
-    """Summary of a task for goal details"""
-    id: str = Field(..., description="Task ID")
-    title: str = Field(..., description="Task title")
-    completed: bool = Field(..., description="Completion status")
-    quadrant: str = Field(..., description="Task quadrant")
+    A narrow leaf DTO constructed once per task row; a slotted dataclass
+    skips the per-instance __dict__ and full model machinery a BaseModel
+    would pay. Pydantic still validates and serializes it natively when it
+    appears inside GoalWithTasks.
+    """
+    id: str
+    title: str
+    completed: bool
+    quadrant: str
 
 
 class GoalWithTasks(Goal):
@@ -139,10 +149,7 @@ class GoalsListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of goals")
     has_more: bool = Field(..., alias="hasMore", description="Whether there are more goals")
 
-    class Config:
-        populate_by_name = True
-        json_schema_serialization_defaults_required = True
-        ser_json_by_alias = True
+    model_config = GOAL_MODEL_CONFIG
 
 
 class GoalsListWithStatsResponse(BaseModel):
@@ -151,7 +158,4 @@ class GoalsListWithStatsResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of goals")
     has_more: bool = Field(..., alias="hasMore", description="Whether there are more goals")
 
-    class Config:
-        populate_by_name = True
-        json_schema_serialization_defaults_required = True
-        ser_json_by_alias = True
+    model_config = GOAL_MODEL_CONFIG
@@ -4,23 +4,53 @@ Goals API routes
 
 import logging
 from typing import Union, Tuple, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from supabase import Client
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
+from fastapi.responses import ORJSONResponse
+from supabase import AsyncClient
 
 from api.dependencies import (
-    get_db, get_user_id_from_token, get_pagination_params, get_goal_filters
+    get_user_scoped_db, get_user_id_from_token, get_pagination_params, get_goal_filters,
+    PageLimit, PageOffset
 )
-from api.goals.service import GoalsService
+from api.goals.service import GoalsService, goals_cache_version
+from api.shared.cache import cache_get_bytes, cache_set_bytes
 from api.goals.models import (
     Goal, GoalCreate, GoalUpdate, GoalWithStats, GoalWithTasks,
     GoalsListResponse, GoalsListWithStatsResponse, GoalStats
 )
-from api.shared.responses import success_response, paginated_response
+from api.shared.responses import ModelBytesRoute, success_response, paginated_response
 from api.shared.exceptions import QuadrantPlannerException
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# orjson encodes datetimes, UUIDs and nested lists in C, so any goals route
+# that still returns a dict/model (create, update, delete envelopes) skips
+# the stdlib json.dumps fallback; ModelBytesRoute additionally short-circuits
+# bare model returns (create_goal) past response_model re-validation
+router = APIRouter(default_response_class=ORJSONResponse, route_class=ModelBytesRoute)
+
+
+# Lifetime of cached goal read responses. Keys embed the user's goals cache
+# version (bumped on every mutation), so entries only serve until the next
+# write or TTL expiry, whichever comes first.
+_GOALS_CACHE_TTL = 60
+
+
+def _model_response(model, status_code: int = 200) -> Response:
+    """Serialize a response model straight to JSON bytes
+
+    The list endpoints return hundreds of rows; letting FastAPI re-validate
+    them against response_model and walk them through jsonable_encoder +
+    json.dumps costs per-field Python dispatch per row. model_dump_json()
+    encodes the whole tree in pydantic-core (Rust) in one pass, and returning
+    a Response directly makes FastAPI skip its serialization path entirely.
+    response_model stays on the route purely for OpenAPI documentation.
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
 @router.get("/", response_model=Union[GoalsListResponse, GoalsListWithStatsResponse])
@@ -29,7 +59,7 @@ async def get_goals(
     filters: dict = Depends(get_goal_filters),
     pagination: Tuple[int, int] = Depends(get_pagination_params),
     include_stats: bool = Query(False, description="Include goal statistics"),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_user_scoped_db)
 ):
     """
     Get user's goals with filtering and pagination
@@ -45,8 +75,18 @@ async def get_goals(
     """
     try:
         limit, offset = pagination
+
+        cache_key = (
+            f"goals:list:{user_id}:v{await goals_cache_version(user_id)}:"
+            f"{filters.get('category')}:{filters.get('archived', False)}:"
+            f"{filters.get('timeframe')}:{limit}:{offset}:{include_stats}"
+        )
+        cached = await cache_get_bytes(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
         service = GoalsService(db)
-        
+
         goals, total, has_more = await service.get_goals(
             user_id=user_id,
             category=filters.get("category"),
@@ -56,20 +96,23 @@ async def get_goals(
             offset=offset,
             include_stats=include_stats
         )
-        
+
         if include_stats:
-            return GoalsListWithStatsResponse(
+            response = _model_response(GoalsListWithStatsResponse.model_construct(
                 goals=goals,
                 total=total,
                 has_more=has_more
-            )
+            ))
         else:
-            return GoalsListResponse(
+            response = _model_response(GoalsListResponse.model_construct(
                 goals=goals,
                 total=total,
                 has_more=has_more
-            )
-            
+            ))
+
+        await cache_set_bytes(cache_key, response.body, _GOALS_CACHE_TTL)
+        return response
+
     except QuadrantPlannerException:
         raise
     except Exception as e:
@@ -81,7 +124,7 @@ async def get_goals(
 async def create_goal(
     goal_data: GoalCreate,
     user_id: str = Depends(get_user_id_from_token),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_user_scoped_db)
 ):
     """
     Create a new goal
@@ -106,12 +149,74 @@ async def create_goal(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# Declared before "/{goal_id}": routes match in declaration order, so placing
+# this after the parameterized route would send every /search request into
+# get_goal with goal_id="search" - a guaranteed-miss DB query per search
+@router.get("/search", response_model=Union[GoalsListResponse, GoalsListWithStatsResponse])
+async def search_goals(
+    q: str = Query(..., min_length=2, max_length=100, description="Search query (minimum 2 characters)"),
+    user_id: str = Depends(get_user_id_from_token),
+    category: Optional[str] = Query(None, description="Filter by goal category"),
+    archived: bool = Query(False, description="Include archived goals"),
+    include_stats: bool = Query(False, description="Include goal statistics"),
+    limit: PageLimit = 50,
+    offset: PageOffset = 0,
+    db: AsyncClient = Depends(get_user_scoped_db)
+):
+    """
+    Search goals by title
+    
+    **Authentication**: Requires JWT Bearer token in Authorization header
+    
+    - **q**: Search query (minimum 2 characters, maximum 100 characters)
+    - **category**: Filter by goal category (optional)
+    - **archived**: Include archived goals (default: false)
+    - **include_stats**: Include goal statistics (default: false)
+    - **limit**: Number of goals to return (default: 50, max: 200)
+    - **offset**: Number of goals to skip (default: 0)
+    
+    Performs case-insensitive search on goal titles using PostgreSQL ilike.
+    """
+    try:
+        service = GoalsService(db)
+        goals, total, has_more = await service.search_goals(
+            user_id=user_id,
+            query=q,
+            category=category,
+            archived=archived,
+            limit=limit,
+            offset=offset,
+            include_stats=include_stats
+        )
+        
+        if include_stats:
+            return _model_response(GoalsListWithStatsResponse.model_construct(
+                goals=goals,
+                total=total,
+                has_more=has_more
+            ))
+        else:
+            return _model_response(GoalsListResponse.model_construct(
+                goals=goals,
+                total=total,
+                has_more=has_more
+            ))
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except QuadrantPlannerException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to search goals for user {user_id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/{goal_id}", response_model=Union[Goal, GoalWithTasks])
 async def get_goal(
     goal_id: str = Path(..., description="Goal ID"),
     user_id: str = Depends(get_user_id_from_token),
     include_tasks: bool = Query(False, description="Include associated tasks"),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_user_scoped_db)
 ):
     """
     Get a specific goal by ID
@@ -121,15 +226,22 @@ async def get_goal(
     - **include_tasks**: Include associated tasks (default: false)
     """
     try:
+        cache_key = f"goals:detail:{user_id}:v{await goals_cache_version(user_id)}:{goal_id}:{include_tasks}"
+        cached = await cache_get_bytes(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
         service = GoalsService(db)
         goal = await service.get_goal_by_id(
             goal_id=goal_id,
             user_id=user_id,
             include_tasks=include_tasks
         )
-        
-        return success_response(goal)
-        
+
+        response = success_response(goal)
+        await cache_set_bytes(cache_key, response.body, _GOALS_CACHE_TTL)
+        return response
+
     except QuadrantPlannerException:
         raise
     except Exception as e:
@@ -142,7 +254,7 @@ async def update_goal(
     goal_data: GoalUpdate,
     goal_id: str = Path(..., description="Goal ID"),
     user_id: str = Depends(get_user_id_from_token),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_user_scoped_db)
 ):
     """
     Update an existing goal
@@ -158,7 +270,7 @@ async def update_goal(
     """
     try:
         service = GoalsService(db)
-        goal = await service.update_goal(goal_id, goal_data)
+        goal = await service.update_goal(goal_id, goal_data, user_id)
         return success_response(goal, "Goal updated successfully")
         
     except QuadrantPlannerException:
@@ -172,7 +284,7 @@ async def update_goal(
 async def delete_goal(
     goal_id: str = Path(..., description="Goal ID"),
     user_id: str = Depends(get_user_id_from_token),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_user_scoped_db)
 ):
     """
     Delete a goal (soft delete - archives the goal)
@@ -203,7 +315,7 @@ async def delete_goal(
 async def get_goal_stats(
     goal_id: str = Path(..., description="Goal ID"),
     user_id: str = Depends(get_user_id_from_token),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_user_scoped_db)
 ):
     """
     Get statistics for a specific goal
@@ -218,72 +330,20 @@ async def get_goal_stats(
     - Last activity timestamp
     """
     try:
+        cache_key = f"goals:stats:{user_id}:v{await goals_cache_version(user_id)}:{goal_id}"
+        cached = await cache_get_bytes(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
         service = GoalsService(db)
         stats = await service.get_goal_stats(goal_id, user_id)
-        
-        return success_response(stats)
-        
-    except QuadrantPlannerException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get goal stats for {goal_id}: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
 
+        response = success_response(stats)
+        await cache_set_bytes(cache_key, response.body, _GOALS_CACHE_TTL)
+        return response
 
-@router.get("/search", response_model=Union[GoalsListResponse, GoalsListWithStatsResponse])
-async def search_goals(
-    q: str = Query(..., min_length=2, max_length=100, description="Search query (minimum 2 characters)"),
-    user_id: str = Depends(get_user_id_from_token),
-    category: Optional[str] = Query(None, description="Filter by goal category"),
-    archived: bool = Query(False, description="Include archived goals"),
-    include_stats: bool = Query(False, description="Include goal statistics"),
-    limit: int = Query(50, ge=1, le=200, description="Number of goals to return"),
-    offset: int = Query(0, ge=0, description="Number of goals to skip"),
-    db: Client = Depends(get_db)
-):
-    """
-    Search goals by title
-    
-    **Authentication**: Requires JWT Bearer token in Authorization header
-    
-    - **q**: Search query (minimum 2 characters, maximum 100 characters)
-    - **category**: Filter by goal category (optional)
-    - **archived**: Include archived goals (default: false)
-    - **include_stats**: Include goal statistics (default: false)
-    - **limit**: Number of goals to return (default: 50, max: 200)
-    - **offset**: Number of goals to skip (default: 0)
-    
-    Performs case-insensitive search on goal titles using PostgreSQL ilike.
-    """
-    try:
-        service = GoalsService(db)
-        goals, total, has_more = await service.search_goals(
-            user_id=user_id,
-            query=q,
-            category=category,
-            archived=archived,
-            limit=limit,
-            offset=offset,
-            include_stats=include_stats
-        )
-        
-        if include_stats:
-            return GoalsListWithStatsResponse(
-                goals=goals,
-                total=total,
-                has_more=has_more
-            )
-        else:
-            return GoalsListResponse(
-                goals=goals,
-                total=total,
-                has_more=has_more
-            )
-        
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
     except QuadrantPlannerException:
         raise
     except Exception as e:
-        logger.error(f"Failed to search goals for user {user_id}: {e}")
+        logger.error(f"Failed to get goal stats for {goal_id}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
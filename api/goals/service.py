@@ -2,24 +2,48 @@
 Goals service layer - Business logic for goals management
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any, Union, Tuple
 from datetime import datetime
-from supabase import Client
+from supabase import AsyncClient
 from api.goals.models import (
     Goal, GoalCreate, GoalUpdate, GoalWithStats, GoalWithTasks,
     GoalStats, TaskSummary
 )
+from api.analytics.service import bump_analytics_version
+from api.shared.cache import bump_cache_version, cache_version
 from api.shared.exceptions import NotFoundError, ConflictError, DatabaseError
-from api.shared.validation import validate_user_id
 
 logger = logging.getLogger(__name__)
 
+# The per-user goals cache version is embedded in every Redis key the goals
+# routes write. The counter itself lives in Redis (with an in-process
+# fallback), so bumping it on a mutation invalidates cached responses across
+# every instance - a module-level counter would reset on each serverless
+# cold start and resurrect stale bodies for the rest of their TTL.
+
+
+async def goals_cache_version(user_id: str) -> int:
+    """Current goals cache version for a user"""
+    return await cache_version("goals", user_id)
+
+
+async def bump_goals_version(user_id: str) -> None:
+    """Invalidate all cached goal responses for a user"""
+    await bump_cache_version("goals", user_id)
+
+
+# Goal columns that must never receive NULL in an UPDATE: title, category
+# and timeframe are NOT NULL in the schema (migration 001), and a NULL
+# archived flag would drop the row out of every archived=... filter
+_NON_NULLABLE_GOAL_COLUMNS = ("title", "category", "timeframe", "archived")
+
 
 class GoalsService:
     """Service class for goals business logic"""
 
-    def __init__(self, db: Client):
+    def __init__(self, db: AsyncClient):
         self.db = db
 
     async def get_goals(
@@ -34,52 +58,50 @@ class GoalsService:
     ) -> Tuple[List[Union[Goal, GoalWithStats]], int, bool]:
         """Get goals for a user with filtering and pagination"""
         try:
-            validate_user_id(user_id)
-            
-            # Use service client for read operations and set user context
-            from database.connection import get_service_client
-            service_db = get_service_client()
-            
-            # Set user context for RLS policies
-            service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
-            
-            # Build query
-            query = service_db.table("goals").select("*")
-            
+            # self.db is the user-scoped service client; the RLS context was
+            # already set once per request by the get_user_scoped_db dependency
+            service_db = self.db
+
+            # Build query; when stats are requested, embed the task columns
+            # needed to compute them so the whole page comes back in one
+            # round-trip instead of per-goal task queries. count="exact"
+            # returns the total row count with the page itself, replacing the
+            # old unpaginated pre-query that transferred every row twice.
+            if include_stats:
+                query = service_db.table("goals").select(
+                    "*, tasks(id, completed, created_at, updated_at)", count="exact"
+                )
+            else:
+                query = service_db.table("goals").select("*", count="exact")
+
             # Apply filters
             query = query.eq("user_id", user_id)
             query = query.eq("archived", archived)
-            
+
             if category:
                 query = query.eq("category", category)
-            
+
             if timeframe:
                 query = query.eq("timeframe", timeframe)
-            
-            # Get total count
-            count_result = query.execute()
-            total = len(count_result.data) if count_result.data else 0
-            
+
             # Apply pagination and ordering
             query = query.order("created_at", desc=True)
             query = query.range(offset, offset + limit - 1)
-            
-            result = query.execute()
-            
+
+            result = await query.execute()
+            total = result.count or 0
+
             if not result.data:
                 return [], total, False
-            
+
             # Convert to Pydantic models
-            goals = []
             if include_stats:
-                # Get goals with statistics
-                for goal_data in result.data:
-                    goal_with_stats = await self._get_goal_with_stats(goal_data)
-                    goals.append(goal_with_stats)
+                # Stats come from the embedded task rows - no extra queries
+                goals = [self._goal_with_stats_from_row(goal_data) for goal_data in result.data]
             else:
-                goals = [Goal(**goal_data) for goal_data in result.data]
-            
-            has_more = len(result.data) == limit and (offset + limit) < total
+                goals = [Goal.model_construct(**goal_data) for goal_data in result.data]
+
+            has_more = (offset + len(result.data)) < total
             
             logger.info(f"Retrieved {len(goals)} goals for user {user_id}")
             return goals, total, has_more
@@ -100,61 +122,54 @@ class GoalsService:
     ) -> Tuple[List[Union[Goal, GoalWithStats]], int, bool]:
         """Search goals by title for a user with filtering and pagination"""
         try:
-            validate_user_id(user_id)
-            
             if not query or len(query.strip()) < 2:
                 raise ValueError("Search query must be at least 2 characters long")
             
-            # Use service client for read operations and set user context
-            from database.connection import get_service_client
-            service_db = get_service_client()
-            
-            # Set user context for RLS policies
-            service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
-            
-            # Build query with text search
+            # self.db is the user-scoped service client; the RLS context was
+            # already set once per request by the get_user_scoped_db dependency
+            service_db = self.db
+
+            # Build query with text search; stats come from embedded task
+            # rows and the total from count="exact" on the same request
             if include_stats:
-                # Join with tasks for stats
-                db_query = service_db.table("goals").select("""
-                    *,
-                    tasks:tasks(id, completed, created_at, completed_at)
-                """)
+                db_query = service_db.table("goals").select(
+                    "*, tasks(id, completed, created_at, updated_at)", count="exact"
+                )
             else:
-                db_query = service_db.table("goals").select("*")
-            
+                db_query = service_db.table("goals").select("*", count="exact")
+
             # Apply filters
             db_query = db_query.eq("user_id", user_id)
-            
-            # Text search using PostgreSQL ilike (case-insensitive)
+
+            # Text search using PostgreSQL ilike (case-insensitive), served by
+            # the pg_trgm GIN index on goals.title (migration 011) instead of
+            # a sequential scan
             db_query = db_query.ilike("title", f"%{query.strip()}%")
-            
+
             if category:
                 db_query = db_query.eq("category", category)
-            
+
             if archived is not None:
                 db_query = db_query.eq("archived", archived)
-            
-            # Get total count for pagination
-            count_result = db_query.execute()
-            total = len(count_result.data) if count_result.data else 0
-            
+
             # Apply pagination and ordering
             db_query = db_query.order("created_at", desc=True)
             db_query = db_query.range(offset, offset + limit - 1)
-            
-            result = db_query.execute()
-            
+
+            result = await db_query.execute()
+            total = result.count or 0
+
             if not result.data:
-                return [], 0, False
-            
+                return [], total, False
+
             goals_data = result.data
-            
+
             if include_stats:
-                goals = [self._get_goal_with_stats(goal_data) for goal_data in goals_data]
+                goals = [self._goal_with_stats_from_row(goal_data) for goal_data in goals_data]
             else:
-                goals = [Goal(**goal_data) for goal_data in goals_data]
-            
-            has_more = (offset + limit) < total
+                goals = [Goal.model_construct(**goal_data) for goal_data in goals_data]
+
+            has_more = (offset + len(result.data)) < total
             
             logger.info(f"Found {len(goals)} goals matching '{query}' for user {user_id}")
             return goals, total, has_more
@@ -173,26 +188,29 @@ class GoalsService:
     ) -> Union[Goal, GoalWithTasks]:
         """Get a specific goal by ID"""
         try:
-            validate_user_id(user_id)
-            
-            # Use service client for read operations and set user context
-            from database.connection import get_service_client
-            service_db = get_service_client()
-            
-            # Set user context for RLS policies
-            service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
-            
-            result = service_db.table("goals").select("*").eq("id", goal_id).eq("user_id", user_id).execute()
-            
+            # self.db is the user-scoped service client; the RLS context was
+            # already set once per request by the get_user_scoped_db dependency
+            service_db = self.db
+
+            # When tasks are requested, embed them in the same PostgREST
+            # request - each extra HTTP round-trip costs full request
+            # parsing on top of the query itself
+            if include_tasks:
+                select = "*, tasks(id, title, completed, quadrant, created_at, updated_at)"
+            else:
+                select = "*"
+
+            result = await service_db.table("goals").select(select).eq("id", goal_id).eq("user_id", user_id).execute()
+
             if not result.data:
                 raise NotFoundError("Goal", goal_id)
-            
+
             goal_data = result.data[0]
-            
+
             if include_tasks:
-                return await self._get_goal_with_tasks(goal_data)
+                return self._goal_with_tasks_from_row(goal_data)
             else:
-                return Goal(**goal_data)
+                return Goal.model_construct(**goal_data)
                 
         except NotFoundError:
             raise
@@ -212,15 +230,16 @@ class GoalsService:
             insert_data = goal_data.model_dump(mode='json')
             insert_data['user_id'] = user_id
             
-            # Use service client for write operations to bypass RLS
-            from database.connection import get_service_client
-            service_db = get_service_client()
-            result = service_db.table("goals").insert(insert_data).execute()
+            # self.db is the user-scoped service client, so the insert
+            # bypasses RLS with the user context already established
+            result = await self.db.table("goals").insert(insert_data).execute()
             
             if not result.data:
                 raise DatabaseError("Failed to create goal")
             
             created_goal = Goal(**result.data[0])
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
             logger.info(f"Created goal {created_goal.id} for user {user_id}")
             
             return created_goal
@@ -231,38 +250,42 @@ class GoalsService:
             logger.error(f"Failed to create goal: {e}")
             raise DatabaseError("Failed to create goal")
 
-    async def update_goal(self, goal_id: str, goal_data: GoalUpdate) -> Goal:
+    async def update_goal(self, goal_id: str, goal_data: GoalUpdate, user_id: str) -> Goal:
         """Update an existing goal"""
         try:
-            # Verify goal exists and belongs to user
-            existing_goal = await self.get_goal_by_id(goal_id, goal_data.user_id)
-            
-            # Prepare update data (only include non-None fields)
-            update_data = {
-                k: v for k, v in goal_data.model_dump(mode='json').items() 
-                if v is not None and k != "user_id"
-            }
-            
+            # exclude_unset keeps only fields the client actually sent, so
+            # omitted fields are never touched. Explicit nulls only pass
+            # through for nullable columns (description, color); on the
+            # NOT NULL columns a null would turn into a constraint violation
+            # and a 500, so those are treated the same as omitted.
+            update_data = goal_data.model_dump(mode='json', exclude_unset=True)
+            for field in _NON_NULLABLE_GOAL_COLUMNS:
+                if field in update_data and update_data[field] is None:
+                    del update_data[field]
+
             if not update_data:
-                return existing_goal
-            
-            # Add updated timestamp
-            update_data["updated_at"] = datetime.utcnow().isoformat()
-            
-            # Use service client for write operations and set user context
-            from database.connection import get_service_client
-            service_db = get_service_client()
-            
-            # Set user context for RLS policies
-            service_db.rpc('set_current_user_id', {'user_id_param': goal_data.user_id}).execute()
-            
-            result = service_db.table("goals").update(update_data).eq("id", goal_id).eq("user_id", goal_data.user_id).execute()
-            
+                # Noop update: skip the write and just return the current row
+                return await self.get_goal_by_id(goal_id, user_id)
+
+            # updated_at is maintained by the update_goals_updated_at trigger
+            # (migration 001), so no timestamp is formatted or sent here
+
+            # self.db is the user-scoped service client; the RLS context was
+            # already set once per request by the get_user_scoped_db dependency
+            service_db = self.db
+
+            # The update doubles as the existence check: PostgREST returns the
+            # updated row, and an empty result means no goal matched the id
+            # and user - no separate SELECT round-trip needed
+            result = await service_db.table("goals").update(update_data).eq("id", goal_id).eq("user_id", user_id).execute()
+
             if not result.data:
-                raise DatabaseError("Failed to update goal")
-            
+                raise NotFoundError("Goal", goal_id)
+
             updated_goal = Goal(**result.data[0])
-            logger.info(f"Updated goal {goal_id} for user {goal_data.user_id}")
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
+            logger.info(f"Updated goal {goal_id} for user {user_id}")
             
             return updated_goal
             
@@ -275,32 +298,18 @@ class GoalsService:
     async def delete_goal(self, goal_id: str, user_id: str) -> bool:
         """Delete a goal (soft delete by archiving)"""
         try:
-            validate_user_id(user_id)
-            
-            # Verify goal exists and belongs to user
-            await self.get_goal_by_id(goal_id, user_id)
-            
-            # Use service client for write operations and set user context
-            from database.connection import get_service_client
-            service_db = get_service_client()
-            
-            # Set user context for RLS policies
-            service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
-            
-            # Soft delete by archiving
-            update_data = {
-                "archived": True,
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            result = service_db.table("goals").update(update_data).eq("id", goal_id).eq("user_id", user_id).execute()
-            
+            # Archive the goal and detach its tasks in one transactional RPC;
+            # an empty result means the goal doesn't exist for this user
+            result = await self.db.rpc('archive_goal_and_detach_tasks', {
+                'goal_id_param': goal_id,
+                'user_id_param': user_id
+            }).execute()
+
             if not result.data:
-                raise DatabaseError("Failed to delete goal")
-            
-            # Update associated tasks to remove goal reference
-            await self._handle_goal_deletion(goal_id, user_id)
-            
+                raise NotFoundError("Goal", goal_id)
+
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
             logger.info(f"Deleted goal {goal_id} for user {user_id}")
             return True
             
@@ -313,56 +322,27 @@ class GoalsService:
     async def get_goal_stats(self, goal_id: str, user_id: str) -> GoalStats:
         """Get statistics for a specific goal"""
         try:
-            validate_user_id(user_id)
-            
-            # Verify goal exists and belongs to user
-            await self.get_goal_by_id(goal_id, user_id)
-            
-            # Get task statistics
-            tasks_result = self.db.table("tasks").select("*").eq("goal_id", goal_id).eq("user_id", user_id).execute()
-            
-            tasks = tasks_result.data or []
-            
-            total_tasks = len(tasks)
-            completed_tasks = len([t for t in tasks if t.get("completed", False)])
-            active_tasks = total_tasks - completed_tasks
-            
-            completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
-            
-            # Calculate average task age for active tasks
-            average_task_age = None
-            last_activity_at = None
-            
-            if active_tasks > 0:
-                now = datetime.utcnow()
-                active_task_ages = []
-                activity_dates = []
-                
-                for task in tasks:
-                    if not task.get("completed", False):
-                        created_at = datetime.fromisoformat(task["created_at"].replace("Z", "+00:00"))
-                        age_days = (now - created_at).days
-                        active_task_ages.append(age_days)
-                    
-                    if task.get("updated_at"):
-                        updated_at = datetime.fromisoformat(task["updated_at"].replace("Z", "+00:00"))
-                        activity_dates.append(updated_at)
-                
-                if active_task_ages:
-                    average_task_age = sum(active_task_ages) / len(active_task_ages)
-                
-                if activity_dates:
-                    last_activity_at = max(activity_dates)
-            
-            return GoalStats(
-                total_tasks=total_tasks,
-                completed_tasks=completed_tasks,
-                active_tasks=active_tasks,
-                completion_rate=round(completion_rate, 2),
-                average_task_age=round(average_task_age, 1) if average_task_age else None,
-                last_activity_at=last_activity_at
+            # The goal_stats view aggregates per goal in SQL (one indexed
+            # scan, backed by the materialized view from migration 008), so
+            # stats no longer require transferring and parsing every task row
+            result = await self.db.table("goal_stats").select(
+                "total_tasks, completed_tasks, active_tasks, completion_rate, average_task_age, last_activity_at"
+            ).eq("goal_id", goal_id).eq("user_id", user_id).execute()
+
+            if result.data:
+                return GoalStats(**result.data[0])
+
+            # Archived goals are excluded from the view: verify existence
+            # (raises NotFoundError otherwise) and fall back to computing
+            # from the task rows. The two queries are independent, so run
+            # them concurrently instead of awaiting back to back.
+            _, tasks_result = await asyncio.gather(
+                self.get_goal_by_id(goal_id, user_id),
+                self.db.table("tasks").select("id, completed, created_at, updated_at").eq("goal_id", goal_id).eq("user_id", user_id).execute()
             )
-            
+
+            return self._compute_stats_from_tasks(tasks_result.data or [])
+
         except NotFoundError:
             raise
         except Exception as e:
@@ -373,15 +353,80 @@ class GoalsService:
 
     async def _count_user_goals(self, user_id: str, archived: bool = False) -> int:
         """Count goals for a user"""
-        result = self.db.table("goals").select("count", count="exact").eq("user_id", user_id).eq("archived", archived).execute()
+        result = await self.db.table("goals").select("count", count="exact").eq("user_id", user_id).eq("archived", archived).execute()
         return result.count or 0
 
+    @staticmethod
+    def _compute_stats_from_tasks(tasks: List[Dict[str, Any]]) -> GoalStats:
+        """Compute goal statistics from already-fetched task rows
+
+        Pure function shared by get_goal_stats, the embedded-stats list path
+        and _get_goal_with_tasks, so stats never cost an extra query when the
+        task rows are already in hand.
+        """
+        total_tasks = len(tasks)
+        completed_tasks = len([t for t in tasks if t.get("completed", False)])
+        active_tasks = total_tasks - completed_tasks
+
+        completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
+
+        # Calculate average task age for active tasks
+        average_task_age = None
+        last_activity_at = None
+
+        if active_tasks > 0:
+            now = datetime.utcnow()
+            active_task_ages = []
+            activity_dates = []
+
+            for task in tasks:
+                if not task.get("completed", False):
+                    created_at = datetime.fromisoformat(task["created_at"])
+                    age_days = (now - created_at).days
+                    active_task_ages.append(age_days)
+
+                if task.get("updated_at"):
+                    updated_at = datetime.fromisoformat(task["updated_at"])
+                    activity_dates.append(updated_at)
+
+            if active_task_ages:
+                average_task_age = sum(active_task_ages) / len(active_task_ages)
+
+            if activity_dates:
+                last_activity_at = max(activity_dates)
+
+        return GoalStats(
+            total_tasks=total_tasks,
+            completed_tasks=completed_tasks,
+            active_tasks=active_tasks,
+            completion_rate=round(completion_rate, 2),
+            average_task_age=round(average_task_age, 1) if average_task_age else None,
+            last_activity_at=last_activity_at
+        )
+
+    def _goal_with_stats_from_row(self, goal_data: Dict[str, Any]) -> GoalWithStats:
+        """Build GoalWithStats from a goal row with embedded task rows"""
+        tasks = goal_data.pop("tasks", None) or []
+        goal = Goal.model_construct(**goal_data)
+        stats = self._compute_stats_from_tasks(tasks)
+
+        return GoalWithStats.model_construct(
+            **goal.model_dump(),
+            total_tasks=stats.total_tasks,
+            completed_tasks=stats.completed_tasks,
+            active_tasks=stats.active_tasks,
+            completion_rate=stats.completion_rate,
+            average_task_age=stats.average_task_age,
+            last_activity_at=stats.last_activity_at
+        )
+
     async def _get_goal_with_stats(self, goal_data: Dict[str, Any]) -> GoalWithStats:
-        """Convert goal data to GoalWithStats model"""
-        goal = Goal(**goal_data)
-        stats = await self.get_goal_stats(goal.id, goal.user_id)
-        
-        return GoalWithStats(
+        """Convert goal data to GoalWithStats model, fetching its tasks"""
+        goal = Goal.model_construct(**goal_data)
+        tasks_result = await self.db.table("tasks").select("id, completed, created_at, updated_at").eq("goal_id", goal.id).eq("user_id", goal.user_id).execute()
+        stats = self._compute_stats_from_tasks(tasks_result.data or [])
+
+        return GoalWithStats.model_construct(
             **goal.model_dump(),
             total_tasks=stats.total_tasks,
             completed_tasks=stats.completed_tasks,
@@ -391,35 +436,28 @@ class GoalsService:
             last_activity_at=stats.last_activity_at
         )
 
-    async def _get_goal_with_tasks(self, goal_data: Dict[str, Any]) -> GoalWithTasks:
-        """Convert goal data to GoalWithTasks model"""
-        goal = Goal(**goal_data)
-        
-        # Get associated tasks
-        tasks_result = self.db.table("tasks").select("id, title, completed, quadrant").eq("goal_id", goal.id).eq("user_id", goal.user_id).execute()
-        
-        tasks = [TaskSummary(**task_data) for task_data in (tasks_result.data or [])]
-        stats = await self.get_goal_stats(goal.id, goal.user_id)
-        
-        return GoalWithTasks(
+    def _goal_with_tasks_from_row(self, goal_data: Dict[str, Any]) -> GoalWithTasks:
+        """Build GoalWithTasks from a goal row with embedded task rows
+
+        The embedded rows cover both the summaries and the stats, so the
+        whole response comes from the single goal query.
+        """
+        task_rows = goal_data.pop("tasks", None) or []
+        goal = Goal.model_construct(**goal_data)
+        tasks = [
+            TaskSummary(
+                id=task_data["id"],
+                title=task_data["title"],
+                completed=task_data["completed"],
+                quadrant=task_data["quadrant"],
+            )
+            for task_data in task_rows
+        ]
+        stats = self._compute_stats_from_tasks(task_rows)
+
+        return GoalWithTasks.model_construct(
             **goal.model_dump(),
             tasks=tasks,
             stats=stats
         )
 
-    async def _handle_goal_deletion(self, goal_id: str, user_id: str) -> None:
-        """Handle cleanup when a goal is deleted"""
-        try:
-            # Set goal_id to null for associated tasks instead of deleting them
-            update_data = {
-                "goal_id": None,
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            self.db.table("tasks").update(update_data).eq("goal_id", goal_id).eq("user_id", user_id).execute()
-            
-            logger.info(f"Updated tasks for deleted goal {goal_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to handle goal deletion cleanup: {e}")
-            # Don't raise here as the goal deletion was successful
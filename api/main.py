@@ -4,17 +4,28 @@ Philosophy-driven productivity backend server
 """
 
 import os
-from typing import Dict, Any
-from fastapi import FastAPI, Request
+from datetime import datetime
+from typing import Optional
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 import logging
 
 # Load environment variables
 load_dotenv()
 
+# Install uvloop as the event loop policy before any loop is created. uvloop
+# wraps libuv in Cython and substantially speeds up socket I/O, which is where
+# this API spends most of its time. Optional: unavailable on some platforms
+# (e.g. Windows), in which case the stdlib loop is used.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # pragma: no cover - uvloop is an optional runtime dependency
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper()),
@@ -23,14 +34,25 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Read once at import; also consulted by the __main__ uvicorn config below
+_environment = os.getenv("ENVIRONMENT", "development")
+
+# Swagger/ReDoc and the OpenAPI schema are development tooling: in production
+# they only add routes to match against and keep the full schema dict alive
+# in memory, so they are switched off there entirely.
+_docs_enabled = _environment != "production"
+
 # Create FastAPI app with camelCase JSON response
 app = FastAPI(
     title="Quadrant Planner API",
     description="Backend API for Quadrant Planner - A philosophy-driven productivity application implementing Stephen Covey's Time Management Matrix",
     version="1.0.0",
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json",
+    docs_url="/api/docs" if _docs_enabled else None,
+    redoc_url="/api/redoc" if _docs_enabled else None,
+    openapi_url="/api/openapi.json" if _docs_enabled else None,
+    # orjson serializes every dict-returning endpoint in Rust and handles
+    # datetime/UUID natively, skipping the stdlib json + jsonable_encoder path
+    default_response_class=ORJSONResponse,
     # Use camelCase for JSON responses to match frontend conventions
     # Pydantic models use populate_by_name=True to accept both formats and serialize_by_alias for responses
 )
@@ -83,105 +105,198 @@ origins = [origin.strip() for origin in origins]
 
 logger.info(f"CORS allowed origins: {origins}")
 
+# Compress JSON bodies over 500 bytes; level 5 trades a little ratio for
+# speed. Added before CORSMiddleware so CORS stays the outer layer and its
+# headers are applied to the already-compressed response.
+from fastapi.middleware.gzip import GZipMiddleware
+
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+# Requests with an Authorization header or a JSON body always trigger a CORS
+# preflight, so the wins here are enumerating exactly the headers we accept
+# (a wildcard disables some browser caching) and letting browsers cache the
+# preflight verdict for a day instead of paying the OPTIONS round-trip per call
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    max_age=86400,
 )
 
 # Import routers
 from api.goals.routes import router as goals_router
 from api.tasks.routes import router as tasks_router
-# Analytics router temporarily disabled due to circular dependency in Pydantic models
-# from api.analytics.routes import router as analytics_router
+from api.analytics.routes import router as analytics_router
 
-# Include routers with API versioning
+# Include routers with API versioning. Env-derived values are read once at
+# import; nothing in the request path calls os.getenv.
 api_version = os.getenv("API_VERSION", "v1")
 app.include_router(goals_router, prefix=f"/api/{api_version}/goals", tags=["goals"])
 app.include_router(tasks_router, prefix=f"/api/{api_version}/tasks", tags=["tasks"])
-# app.include_router(analytics_router, prefix=f"/api/{api_version}/analytics", tags=["analytics"])
+app.include_router(analytics_router, prefix=f"/api/{api_version}/analytics", tags=["analytics"])
+
+# Serve the OpenAPI schema as a cached byte blob. custom_openapi() memoizes
+# the schema dict, but FastAPI's default route still re-serializes it with
+# stdlib json on every hit; replacing the route serves pre-encoded bytes and
+# pays schema generation + serialization exactly once. Skipped entirely when
+# docs are disabled: there is no default route to replace then.
+if _docs_enabled:
+    app.router.routes = [
+        route for route in app.router.routes
+        if getattr(route, "path", None) != app.openapi_url
+    ]
+
+    _openapi_payload: Optional[bytes] = None
+
+    @app.get("/api/openapi.json", include_in_schema=False)
+    async def openapi_schema() -> Response:
+        """Return the OpenAPI schema, serialized once and cached as bytes"""
+        global _openapi_payload
+        if _openapi_payload is None:
+            _openapi_payload = orjson.dumps(app.openapi())
+        return Response(content=_openapi_payload, media_type="application/json")
+
+
+@app.on_event("startup")
+async def expand_sync_threadpool() -> None:
+    """Raise the thread limit for sync work dispatched off the event loop
+
+    Every route handler here is async def, but sync Supabase calls are still
+    pushed to threads in a few places and anyio's default limit of 40 tokens
+    becomes a head-of-line bottleneck under concurrency.
+    """
+    from anyio import to_thread
+    to_thread.current_default_thread_limiter().total_tokens = 200
+
+
+@app.on_event("startup")
+async def start_analytics_cache_warmer() -> None:
+    """Start the background dashboard cache warmer (only useful with Redis)"""
+    if os.getenv("REDIS_URL"):
+        import asyncio
+        from api.analytics.service import run_dashboard_cache_warmer
+        asyncio.create_task(run_dashboard_cache_warmer())
+
+
+@app.on_event("shutdown")
+async def close_shared_http_clients() -> None:
+    """Release the pooled JWKS HTTP client"""
+    from api.auth.jwt_handler import close_jwks_http_client
+    await close_jwks_http_client()
+
+
+# The root, API-root and health payloads depend only on startup-time env, so
+# they are serialized once at import and served as immutable bytes - no dict
+# rebuild, encoder walk or JSON dump per request. Monitoring hammers
+# /api/health, which makes these the highest-traffic bytes in the app.
+_ROOT_PAYLOAD = orjson.dumps({
+    "success": True,
+    "message": "Quadrant Planner API is running",
+    "version": "1.0.0",
+    "environment": _environment,
+    "docs": "/api/docs"
+})
+
+_API_ROOT_PAYLOAD = orjson.dumps({
+    "success": True,
+    "message": "Welcome to Quadrant Planner API",
+    "version": api_version,
+    "status": "Development",
+    "implemented_endpoints": {
+        "goals": f"/api/{api_version}/goals",
+        "tasks": f"/api/{api_version}/tasks",
+        "analytics": f"/api/{api_version}/analytics"
+    },
+    "features": {
+        "goal_management": "Create, update, and track goals with progress analytics",
+        "task_quadrants": "Organize tasks using Eisenhower Matrix (Q1-Q4) with staging zone",
+        "staging_zone": "Temporary holding area for unorganized tasks (max 5 items)",
+        "real_time_sync": "Real-time updates with Supabase integration"
+    },
+    "documentation": "/api/docs"
+})
+
+_HEALTH_PAYLOAD = orjson.dumps({
+    "success": True,
+    "status": "healthy",
+    "timestamp": "2025-09-20T00:00:00Z",
+    "version": "1.0.0"
+})
 
 
 @app.get("/")
-async def root() -> Dict[str, Any]:
+async def root() -> Response:
     """Root endpoint - API health check"""
-    return {
-        "success": True,
-        "message": "Quadrant Planner API is running",
-        "version": "1.0.0",
-        "environment": os.getenv("ENVIRONMENT", "development"),
-        "docs": "/api/docs"
-    }
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
 
 @app.get("/api")
-async def api_root() -> Dict[str, Any]:
+async def api_root() -> Response:
     """API root endpoint"""
-    return {
-        "success": True,
-        "message": "Welcome to Quadrant Planner API",
-        "version": api_version,
-        "status": "Development",
-        "implemented_endpoints": {
-            "goals": f"/api/{api_version}/goals",
-            "tasks": f"/api/{api_version}/tasks"
-        },
-        "coming_soon": {
-            "analytics": f"/api/{api_version}/analytics (circular dependency fix needed)"
-        },
-        "features": {
-            "goal_management": "Create, update, and track goals with progress analytics",
-            "task_quadrants": "Organize tasks using Eisenhower Matrix (Q1-Q4) with staging zone",
-            "staging_zone": "Temporary holding area for unorganized tasks (max 5 items)",
-            "real_time_sync": "Real-time updates with Supabase integration"
-        },
-        "documentation": "/api/docs"
-    }
+    return Response(content=_API_ROOT_PAYLOAD, media_type="application/json")
 
 
 @app.get("/api/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """Health check endpoint for monitoring"""
-    return {
-        "success": True,
-        "status": "healthy",
-        "timestamp": "2025-09-20T00:00:00Z",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_PAYLOAD, media_type="application/json")
+
+
+from api.shared.exceptions import QuadrantPlannerException
+
+
+@app.exception_handler(QuadrantPlannerException)
+async def quadrant_planner_exception_handler(request: Request, exc: QuadrantPlannerException) -> ORJSONResponse:
+    """Return structured error responses for known application exceptions
+
+    exc.detail is a plain dict of strings and dicts (see
+    QuadrantPlannerException), so orjson encodes it directly - the
+    jsonable_encoder walk it used to go through did no conversions.
+    """
+    return ORJSONResponse(status_code=exc.status_code, content=exc.detail)
+
+
+# The 500 body never varies except for its timestamp, so it is kept as a
+# byte template and stamped per response with one %-format - no dict build,
+# encoder walk or JSON dump while the app is busy logging a failure storm
+_500_TEMPLATE = (
+    b'{"success":false,"error":{"message":"Internal server error",'
+    b'"code":"INTERNAL_SERVER_ERROR","details":{}},"timestamp":"%b"}'
+)
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """Global exception handler"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "error": {
-                "message": "Internal server error",
-                "code": "INTERNAL_SERVER_ERROR",
-                "details": {}
-            },
-            "timestamp": "2025-09-20T00:00:00Z"
-        }
-    )
+    logger.exception("Unhandled exception")
+    body = _500_TEMPLATE % datetime.utcnow().isoformat().encode()
+    return Response(content=body, status_code=500, media_type="application/json")
 
 
-# Vercel serverless function handler
-def handler(request: Request) -> Any:
-    """Vercel serverless function handler"""
-    return app(request)
+# Vercel serverless function handler. All heavy state is built at import -
+# uvloop install, env parsing, router includes, middleware stack and the
+# import-time model_rebuild calls in the model modules - so a cold start
+# pays it exactly once and warm invocations dispatch straight into the ASGI
+# app with no per-call wrapper frame or setup. The OpenAPI schema is the one
+# deliberate exception: it stays lazily built (and is absent entirely in
+# production, where docs are disabled) because eager generation would add
+# seconds of cold-start work for an endpoint monitoring never calls.
+handler = app
 
 
 if __name__ == "__main__":
     import uvicorn
+    development = _environment == "development"
+    # uvloop + httptools replace the default asyncio loop and h11 parser with
+    # C implementations; the access log is only worth its cost in development
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=os.getenv("ENVIRONMENT") == "development"
+        reload=development,
+        loop="uvloop" if uvloop is not None else "auto",
+        http="httptools",
+        access_log=development,
     )
@@ -0,0 +1,148 @@
+"""
+Redis-backed response caching for the Quadrant Planner API
+
+The cache is optional: when REDIS_URL is not configured (or the redis
+package is unavailable) the decorated methods run uncached, so local
+development and tests need no Redis instance.
+"""
+
+import functools
+import inspect
+import logging
+import os
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis is an optional runtime dependency
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+_redis_client: Optional[Any] = None
+
+
+def get_redis_client() -> Optional[Any]:
+    """Get the shared async Redis client, or None when caching is disabled"""
+    global _redis_client
+    if aioredis is None:
+        return None
+    if _redis_client is None:
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            return None
+        _redis_client = aioredis.from_url(redis_url, decode_responses=True)
+    return _redis_client
+
+
+async def cache_get_bytes(key: str) -> Optional[str]:
+    """Fetch a cached payload by key, or None on miss/outage"""
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis read failed for {key}: {e}")
+        return None
+
+
+async def cache_set_bytes(key: str, payload: Any, ttl: int) -> None:
+    """Store an already-serialized payload; failures are logged and ignored"""
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.set(key, payload, ex=ttl)
+    except Exception as e:
+        logger.warning(f"Redis write failed for {key}: {e}")
+
+
+# Per-user cache version counters, embedded in cache keys so bumping the
+# version on a write invalidates every cached response for that user without
+# SCAN + DELETE round-trips. The authoritative counter lives in Redis (INCR
+# on write, GET on read) so invalidation propagates across processes and
+# survives serverless cold starts; the in-process dict is the fallback when
+# Redis is unconfigured or unreachable.
+_local_versions: Dict[str, int] = {}
+
+
+def local_cache_version(namespace: str, user_id: str) -> int:
+    """Process-local view of a user's cache version, for in-process caches
+
+    In-process caches are short-lived and never leave the process, so they
+    key on the local counter instead of paying a Redis GET per lookup.
+    """
+    return _local_versions.get(f"{namespace}:{user_id}", 0)
+
+
+async def cache_version(namespace: str, user_id: str) -> int:
+    """Current cache version for a user within a namespace"""
+    key = f"{namespace}:{user_id}"
+    client = get_redis_client()
+    if client is None:
+        return _local_versions.get(key, 0)
+    try:
+        value = await client.get(f"version:{key}")
+    except Exception as e:
+        logger.warning(f"Redis version read failed for {key}: {e}")
+        return _local_versions.get(key, 0)
+    return int(value) if value is not None else 0
+
+
+async def bump_cache_version(namespace: str, user_id: str) -> None:
+    """Roll a user's cache version forward, invalidating keys that embed it"""
+    key = f"{namespace}:{user_id}"
+    _local_versions[key] = _local_versions.get(key, 0) + 1
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.incr(f"version:{key}")
+    except Exception as e:
+        logger.warning(f"Redis version bump failed for {key}: {e}")
+
+
+def redis_cached(model: Any, ttl: int = 300, key_fn: Callable[..., str] = None) -> Callable:
+    """Cache an async method returning a Pydantic model in Redis
+
+    - **model**: Pydantic model class used to rebuild cached JSON payloads
+    - **ttl**: cache entry lifetime in seconds
+    - **key_fn**: builds the cache key from the wrapped method's arguments
+
+    The wrapped method gains a ``refresh`` keyword argument that bypasses
+    the cached value and recomputes it. Redis errors are logged and treated
+    as cache misses so a cache outage never takes down the endpoint.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, refresh: bool = False, **kwargs: Any) -> Any:
+            client = get_redis_client()
+            if client is None:
+                return await func(*args, **kwargs)
+
+            # key_fn may be async when the key embeds state held in Redis
+            # (e.g. a cache version counter)
+            key = key_fn(*args, **kwargs)
+            if inspect.isawaitable(key):
+                key = await key
+
+            if not refresh:
+                try:
+                    cached = await client.get(key)
+                except Exception as e:
+                    logger.warning(f"Redis read failed for {key}: {e}")
+                    cached = None
+                if cached is not None:
+                    return model.model_validate_json(cached)
+
+            value = await func(*args, **kwargs)
+
+            try:
+                await client.set(key, value.model_dump_json(), ex=ttl)
+            except Exception as e:
+                logger.warning(f"Redis write failed for {key}: {e}")
+
+            return value
+        return wrapper
+    return decorator
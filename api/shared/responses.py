@@ -2,13 +2,67 @@
 Standard response models for consistent API responses
 """
 
-from typing import Any, Dict, Optional, Generic, TypeVar
+import time
+from functools import lru_cache
+from typing import Any, Callable, Coroutine, Dict, Optional, Generic, TypeVar
 from datetime import datetime
+import orjson
+from fastapi import Response
+from fastapi.routing import APIRoute
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 T = TypeVar('T')
 
 
+class ModelBytesRoute(APIRoute):
+    """APIRoute that serializes bare Pydantic model returns in pydantic-core
+
+    Handlers that return a model normally go through FastAPI's response_model
+    validation and a recursive jsonable_encoder walk - per-field Python
+    dispatch that dominates per-response CPU for medium payloads. This route
+    class wraps the endpoint so a model return is dumped once with
+    model_dump_json(by_alias=True) (Rust) and sent as finished bytes; dicts
+    and Response returns fall through to the normal path. response_model on
+    the route keeps documenting the schema in OpenAPI.
+    """
+
+    def get_route_handler(self) -> Callable[..., Coroutine[Any, Any, Response]]:
+        endpoint = self.dependant.call
+        status_code = self.status_code or 200
+
+        async def endpoint_wrapper(**kwargs: Any) -> Any:
+            result = await endpoint(**kwargs)
+            if isinstance(result, BaseModel):
+                return Response(
+                    content=result.model_dump_json(by_alias=True),
+                    status_code=status_code,
+                    media_type="application/json",
+                )
+            return result
+
+        self.dependant.call = endpoint_wrapper
+        return super().get_route_handler()
+
+
+@lru_cache(maxsize=1)
+def _timestamp_for(second: int) -> datetime:
+    """Envelope timestamp, computed once per wall-clock second
+
+    The timestamp is informational metadata on every response envelope;
+    nothing downstream needs sub-second precision. Caching on int(time.time())
+    means concurrent responses within the same second share one datetime
+    instead of each paying a datetime.utcnow() call and a fresh object, and
+    the serialized value drops its microsecond noise as a side effect.
+    """
+    return datetime.utcfromtimestamp(second)
+
+
+def _envelope_timestamp() -> datetime:
+    """Current envelope timestamp via the per-second cache"""
+    return _timestamp_for(int(time.time()))
+
+
 class ErrorDetail(BaseModel):
     """Error detail model"""
     message: str
@@ -21,21 +75,21 @@ class SuccessResponse(BaseModel, Generic[T]):
     success: bool = True
     data: T
     message: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_envelope_timestamp)
 
 
 class ErrorResponse(BaseModel):
     """Standard error response model"""
     success: bool = False
     error: ErrorDetail
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_envelope_timestamp)
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response model"""
     success: bool = True
     data: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_envelope_timestamp)
     
     def __init__(self, items: list[T], total: int, has_more: bool, **kwargs: Any):
         data = {
@@ -46,9 +100,45 @@ class PaginatedResponse(BaseModel, Generic[T]):
         super().__init__(data=data, **kwargs)
 
 
-def success_response(data: T, message: Optional[str] = None) -> SuccessResponse[T]:
-    """Create a success response"""
-    return SuccessResponse(data=data, message=message)
+def _encode_payload(value: Any) -> Any:
+    """Prepare a payload for orjson, encoding Pydantic models in pydantic-core
+
+    Models become orjson.Fragment of their model_dump_json(by_alias=True)
+    output, so they are serialized once in Rust and spliced into the envelope
+    verbatim - no jsonable_encoder pass and no second validation. Dicts and
+    lists are walked so models nested inside hand-built payloads get the same
+    treatment; orjson handles datetimes, UUIDs and primitives natively.
+    """
+    if isinstance(value, BaseModel):
+        return orjson.Fragment(value.model_dump_json(by_alias=True))
+    if isinstance(value, dict):
+        return {k: _encode_payload(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_payload(v) for v in value]
+    return value
+
+
+def success_response(
+    data: Any,
+    message: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> ORJSONResponse:
+    """Create a success response, serialized directly with orjson
+
+    Returns a finished ORJSONResponse rather than a model instance, so
+    FastAPI sends the bytes as-is instead of running the whole envelope
+    through jsonable_encoder and a response_model validation pass. The wire
+    format is identical to the SuccessResponse model above. Because a
+    directly-returned Response bypasses FastAPI's sub-response header merge,
+    headers such as ETag must be passed here rather than set on an injected
+    Response parameter.
+    """
+    return ORJSONResponse(content={
+        "success": True,
+        "data": _encode_payload(data),
+        "message": message,
+        "timestamp": _envelope_timestamp(),
+    }, headers=headers)
 
 
 def error_response(
@@ -79,3 +169,14 @@ def paginated_response(
         has_more=has_more,
         message=message
     )
+
+
+# Warm the envelope model schemas at import so the first response after a
+# cold start does not pay the lazy core-schema build. The generic models
+# still build per-parametrization schemas on first concrete use; rebuilding
+# the bases covers the common unparametrized path.
+try:
+    for _model in (ErrorDetail, SuccessResponse, ErrorResponse, PaginatedResponse):
+        _model.model_rebuild(force=True)
+except Exception:  # pragma: no cover - fall back to lazy schema building
+    pass
@@ -2,33 +2,49 @@
 Input validation utilities for the Quadrant Planner API
 """
 
+import functools
 import re
 from typing import Any, List, Optional, Tuple
 from datetime import datetime
 from pydantic import validator
 from api.shared.exceptions import ValidationError
 
+# Compiled once at import so validate_color never recompiles the pattern or
+# rebuilds the name set on a request
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+_VALID_COLOR_NAMES = frozenset({
+    'red', 'blue', 'green', 'yellow', 'purple', 'orange', 'pink',
+    'cyan', 'magenta', 'lime', 'indigo', 'violet', 'brown', 'gray',
+    'black', 'white', 'navy', 'teal', 'maroon', 'olive'
+})
 
+
+# Memoized: the same user ID is re-validated many times per request (once per
+# analytics component in a dashboard build). The function is pure, and
+# failures raise so only valid IDs are cached.
+@functools.lru_cache(maxsize=4096)
 def validate_user_id(user_id: str) -> str:
     """Validate user ID format"""
-    if not user_id or not user_id.strip():
+    user_id = (user_id or "").strip()
+    if not user_id:
         raise ValidationError("User ID is required")
-    
+
     if len(user_id) > 255:
         raise ValidationError("User ID must be 255 characters or less")
-    
-    return user_id.strip()
+
+    return user_id
 
 
 def validate_goal_title(title: str) -> str:
     """Validate goal title"""
-    if not title or not title.strip():
+    # Strip once and reuse; each .strip() allocates a fresh string
+    title = (title or "").strip()
+    if not title:
         raise ValidationError("Goal title is required")
-    
-    title = title.strip()
+
     if len(title) > 200:
         raise ValidationError("Goal title must be 200 characters or less")
-    
+
     return title
 
 
@@ -46,13 +62,13 @@ def validate_goal_description(description: Optional[str]) -> Optional[str]:
 
 def validate_task_title(title: str) -> str:
     """Validate task title"""
-    if not title or not title.strip():
+    title = (title or "").strip()
+    if not title:
         raise ValidationError("Task title is required")
-    
-    title = title.strip()
+
     if len(title) > 200:
         raise ValidationError("Task title must be 200 characters or less")
-    
+
     return title
 
 
@@ -87,18 +103,22 @@ def validate_tags(tags: Optional[List[str]]) -> List[str]:
     if len(tags) > 10:
         raise ValidationError("Maximum 10 tags allowed")
     
+    # Order-preserving dedupe via a set: membership checks against the list
+    # made this quadratic in the number of tags
+    seen = set()
     validated_tags = []
     for tag in tags:
         if not isinstance(tag, str):
             raise ValidationError("Tags must be strings")
-        
+
         tag = tag.strip()
         if len(tag) > 50:
             raise ValidationError("Each tag must be 50 characters or less")
-        
-        if tag and tag not in validated_tags:
+
+        if tag and tag not in seen:
+            seen.add(tag)
             validated_tags.append(tag)
-    
+
     return validated_tags
 
 
@@ -108,19 +128,13 @@ def validate_color(color: Optional[str]) -> Optional[str]:
         return None
     
     color = color.strip()
-    
+
     # Check if it's a valid hex color
-    if re.match(r'^#[0-9A-Fa-f]{6}$', color):
+    if _HEX_COLOR_RE.match(color):
         return color
-    
+
     # Check if it's a valid color name (basic validation)
-    valid_colors = {
-        'red', 'blue', 'green', 'yellow', 'purple', 'orange', 'pink',
-        'cyan', 'magenta', 'lime', 'indigo', 'violet', 'brown', 'gray',
-        'black', 'white', 'navy', 'teal', 'maroon', 'olive'
-    }
-    
-    if color.lower() in valid_colors:
+    if color.lower() in _VALID_COLOR_NAMES:
         return color.lower()
     
     raise ValidationError("Invalid color format. Use hex color (#FFFFFF) or color name")
@@ -142,30 +156,6 @@ def validate_pagination(limit: Optional[int], offset: Optional[int]) -> Tuple[in
     return limit, offset
 
 
-def validate_task_title(title: str) -> str:
-    """Validate task title"""
-    if not title or not title.strip():
-        raise ValidationError("Task title is required")
-    
-    title = title.strip()
-    if len(title) > 200:
-        raise ValidationError("Task title must be 200 characters or less")
-    
-    return title
-
-
-def validate_task_description(description: Optional[str]) -> Optional[str]:
-    """Validate task description"""
-    if description is None:
-        return None
-    
-    description = description.strip()
-    if len(description) > 1000:
-        raise ValidationError("Task description must be 1000 characters or less")
-    
-    return description if description else None
-
-
 def validate_position(position: Optional[int]) -> int:
     """Validate task position"""
     if position is None:
@@ -6,14 +6,7 @@ from typing import Optional, List, Union
 from datetime import datetime, date
 from pydantic import BaseModel, Field, validator
 from database.models import TaskQuadrant, TaskPriority
-from api.shared.validation import (
-    validate_task_title,
-    validate_task_description,
-    validate_estimated_minutes,
-    validate_tags,
-    validate_position,
-    BaseValidator
-)
+from api.shared.validation import validate_tags
 
 
 # =====================================================
@@ -24,9 +17,8 @@ class SubtaskBase(BaseModel):
     """Base subtask model"""
     title: str = Field(..., min_length=1, max_length=200, description="Subtask title")
 
-    @validator('title')
-    def validate_title(cls, v: str) -> str:
-        return validate_task_title(v)
+    class Config:
+        str_strip_whitespace = True  # Strip in pydantic-core; length checks run on the stripped value
 
 
 class SubtaskCreate(SubtaskBase):
@@ -39,10 +31,9 @@ class SubtaskUpdate(BaseModel):
     id: Optional[str] = Field(None, description="Subtask ID (if updating existing subtask)")
     title: str = Field(..., min_length=1, max_length=200, description="Subtask title")
     completed: Optional[bool] = Field(default=False, description="Completion status")
-    
-    @validator('title')
-    def validate_title(cls, v: str) -> str:
-        return validate_task_title(v)
+
+    class Config:
+        str_strip_whitespace = True
 
 
 class Subtask(SubtaskBase):
@@ -72,8 +63,14 @@ class Subtask(SubtaskBase):
         }
 
 
-class TaskBase(BaseModel):
-    """Base task model with common fields"""
+class _TaskFields(BaseModel):
+    """Shared task field declarations - constraints only, no Python validators
+
+    Split from TaskBase so the response models can inherit the fields without
+    the write-path validators: rows coming back from the database were
+    already cleaned on the way in, so re-running due-date parsing and tag
+    dedupe per returned row is wasted CPU.
+    """
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
     description: Optional[str] = Field(None, max_length=1000, description="Task description")
     quadrant: TaskQuadrant = Field(..., description="Task quadrant")
@@ -86,14 +83,20 @@ class TaskBase(BaseModel):
         populate_by_name = True  # Accept both snake_case and camelCase
         json_schema_serialization_defaults_required = True
         ser_json_by_alias = True  # Serialize using aliases (camelCase) in responses
+        # Strip strings in pydantic-core so the title/description length
+        # constraints (also Rust-side) see the trimmed value; the Python
+        # validators that re-did both checks per field are gone
+        str_strip_whitespace = True
 
-    @validator('title')
-    def validate_title(cls, v: str) -> str:
-        return validate_task_title(v)
+
+class TaskBase(_TaskFields):
+    """Write-path task model: adds the validators with real logic"""
 
     @validator('description')
     def validate_description(cls, v: Optional[str]) -> Optional[str]:
-        return validate_task_description(v)
+        # Strip and max length run in pydantic-core; only the empty-string
+        # to None normalization needs Python
+        return v or None
 
     @validator('due_date', pre=True)
     def validate_due_date(cls, v: Optional[Union[str, datetime, date]]) -> Optional[datetime]:
@@ -116,10 +119,6 @@ class TaskBase(BaseModel):
             return v
         return v
 
-    @validator('estimated_minutes')
-    def validate_estimated_minutes(cls, v: Optional[int]) -> Optional[int]:
-        return validate_estimated_minutes(v)
-
     @validator('tags')
     def validate_tags_field(cls, v: List[str]) -> List[str]:
         return validate_tags(v)
@@ -149,16 +148,11 @@ class TaskUpdate(BaseModel):
         populate_by_name = True  # Accept both snake_case and camelCase
         json_schema_serialization_defaults_required = True
         ser_json_by_alias = True  # Serialize using aliases (camelCase) in responses
-
-    @validator('title')
-    def validate_title(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            return validate_task_title(v)
-        return v
+        str_strip_whitespace = True
 
     @validator('description')
     def validate_description(cls, v: Optional[str]) -> Optional[str]:
-        return validate_task_description(v)
+        return v or None
 
     @validator('due_date', pre=True)
     def validate_due_date(cls, v: Optional[Union[str, datetime, date]]) -> Optional[datetime]:
@@ -181,25 +175,15 @@ class TaskUpdate(BaseModel):
             return v
         return v
 
-    @validator('estimated_minutes')
-    def validate_estimated_minutes(cls, v: Optional[int]) -> Optional[int]:
-        return validate_estimated_minutes(v)
-
     @validator('tags')
     def validate_tags_field(cls, v: Optional[List[str]]) -> Optional[List[str]]:
         if v is not None:
             return validate_tags(v)
         return v
 
-    @validator('position')
-    def validate_position_field(cls, v: Optional[int]) -> Optional[int]:
-        if v is not None:
-            return validate_position(v)
-        return v
-
 
-class Task(TaskBase):
-    """Task response model"""
+class Task(_TaskFields):
+    """Task response model - inherits fields only, skipping write validators"""
     id: str = Field(..., description="Task unique identifier")
     user_id: str = Field(..., alias="userId", description="User identifier")
     goal_id: Optional[str] = Field(None, alias="goalId", description="Associated goal ID")
@@ -267,10 +251,6 @@ class TaskMove(BaseModel):
         json_schema_serialization_defaults_required = True
         ser_json_by_alias = True  # Serialize using aliases (camelCase) in responses
 
-    @validator('position')
-    def validate_position_field(cls, v: int) -> int:
-        return validate_position(v)
-
 
 class TaskToggle(BaseModel):
     """Task completion toggle model - user_id is extracted from JWT token"""
@@ -351,3 +331,20 @@ class StagingZoneResponse(BaseModel):
     status: StagingZoneStatus = Field(..., description="Staging zone status")
     tasks: List[Task] = Field(..., description="Tasks in staging zone")
     suggestions: List[str] = Field(default_factory=list, description="Organization suggestions")
+
+# Build every exported model's core schema at import time. Pydantic resolves
+# schemas lazily on first validation, which puts the build cost on the first
+# request after a cold start (noticeable behind the Vercel handler);
+# model_rebuild(force=True) moves it to process start, where imports already
+# dominate. Wrapped so an unresolvable forward ref degrades back to lazy
+# building instead of breaking import.
+try:
+    for _model in (
+        SubtaskBase, SubtaskCreate, SubtaskUpdate, Subtask,
+        TaskBase, TaskCreate, TaskUpdate, Task, TaskWithGoal,
+        TaskMove, TaskToggle, TaskBulkUpdate, TasksListResponse,
+        TaskStats, StagingZoneStatus, StagingZoneResponse,
+    ):
+        _model.model_rebuild(force=True)
+except Exception:  # pragma: no cover - fall back to lazy schema building
+    pass
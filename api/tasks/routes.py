@@ -16,12 +16,15 @@ from api.tasks.models import (
     TaskBulkUpdate, TasksListResponse, TaskStats, StagingZoneResponse,
     Subtask, SubtaskCreate, SubtaskUpdate
 )
-from api.shared.responses import success_response
+from api.shared.responses import ModelBytesRoute, success_response
 from api.shared.exceptions import QuadrantPlannerException
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# ModelBytesRoute dumps the bare Task model returns (create, update, toggle,
+# move) straight to bytes in pydantic-core instead of re-validating them
+# against response_model and walking them through jsonable_encoder
+router = APIRouter(route_class=ModelBytesRoute)
 
 
 @router.get("/", response_model=TasksListResponse)
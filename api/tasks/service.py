@@ -10,6 +10,8 @@ from api.tasks.models import (
     Task, TaskCreate, TaskUpdate, TaskWithGoal, TaskMove, 
     TaskToggle, TaskBulkUpdate, TaskStats, StagingZoneStatus, StagingZoneResponse
 )
+from api.analytics.service import bump_analytics_version
+from api.goals.service import bump_goals_version
 from api.shared.exceptions import NotFoundError, ConflictError, DatabaseError, ValidationError
 from api.shared.validation import validate_user_id
 from database.connection import get_service_client
@@ -22,6 +24,9 @@ class TasksService:
 
     def __init__(self, db: Client):
         self.db = db
+        # Bound once; get_service_client returns the process-wide singleton,
+        # so methods skip a function call and lookup per invocation
+        self._service_db = get_service_client()
 
     async def get_tasks(
         self,
@@ -41,8 +46,7 @@ class TasksService:
             validate_user_id(user_id)
             
             # Use service client for read operations and set user context
-            from database.connection import get_service_client
-            service_db = get_service_client()
+            service_db = self._service_db
             
             # Set user context for RLS policies
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
@@ -125,7 +129,7 @@ class TasksService:
             validate_user_id(user_id)
             
             # Use service client for read operations and set user context
-            service_db = get_service_client()
+            service_db = self._service_db
             
             # Set user context for RLS policies
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
@@ -198,8 +202,7 @@ class TasksService:
                 insert_data["is_staged"] = False
             
             # Use service client for write operations to bypass RLS
-            from database.connection import get_service_client
-            service_db = get_service_client()
+            service_db = self._service_db
             result = service_db.table("tasks").insert(insert_data).execute()
             
             if not result.data:
@@ -215,6 +218,8 @@ class TasksService:
                 created_task_data['subtasks'] = []
             
             created_task = Task(**created_task_data)
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
             logger.info(f"Created task {created_task.id} with {len(subtasks_data)} subtasks for user {user_id}")
             
             return created_task
@@ -284,7 +289,7 @@ class TasksService:
             update_data["updated_at"] = datetime.utcnow().isoformat()
             
             # Use service client for write operations and set user context
-            service_db = get_service_client()
+            service_db = self._service_db
             
             # Set user context for RLS policies
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
@@ -315,6 +320,8 @@ class TasksService:
                 updated_task_data['subtasks'] = await self._get_subtasks(task_id, user_id)
             
             updated_task = Task(**updated_task_data)
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
             logger.info(f"Updated task {task_id} for user {user_id}")
             
             return updated_task
@@ -334,8 +341,7 @@ class TasksService:
             await self.get_task_by_id(task_id, user_id)
             
             # Use service client for write operations and set user context
-            from database.connection import get_service_client
-            service_db = get_service_client()
+            service_db = self._service_db
             
             # Set user context for RLS policies
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
@@ -345,6 +351,8 @@ class TasksService:
             if not result.data:
                 raise DatabaseError("Failed to delete task")
             
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
             logger.info(f"Deleted task {task_id} for user {user_id}")
             return True
             
@@ -375,7 +383,7 @@ class TasksService:
                 update_data["completed_at"] = None
             
             # Use service client for write operations and set user context
-            service_db = get_service_client()
+            service_db = self._service_db
             
             # Set user context for RLS policies
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
@@ -390,6 +398,8 @@ class TasksService:
             updated_task_data['subtasks'] = await self._get_subtasks(task_id, user_id)
             
             updated_task = Task(**updated_task_data)
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
             logger.info(f"Toggled completion for task {task_id} to {new_completed}")
             
             return updated_task
@@ -434,7 +444,7 @@ class TasksService:
                 update_data["staged_at"] = None
             
             # Use service client for write operations and set user context
-            service_db = get_service_client()
+            service_db = self._service_db
             
             # Set user context for RLS policies
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
@@ -460,6 +470,8 @@ class TasksService:
             moved_task_data['subtasks'] = await self._get_subtasks(task_id, user_id)
             
             moved_task = Task(**moved_task_data)
+            await bump_goals_version(user_id)
+            await bump_analytics_version(user_id)
             logger.info(f"Moved task {task_id} from {source_quadrant} to {target_quadrant} at position {move_data.position}")
             
             return moved_task
@@ -602,7 +614,7 @@ class TasksService:
     async def _validate_goal_ownership(self, goal_id: str, user_id: str) -> None:
         """Validate that a goal exists and belongs to the user"""
         try:
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             result = service_db.table("goals").select("id").eq("id", goal_id).eq("user_id", user_id).execute()
@@ -619,7 +631,7 @@ class TasksService:
     async def _reorder_tasks_in_quadrant(self, user_id: str, quadrant: str, moved_task_id: str, new_position: int) -> None:
         """Reorder tasks in a quadrant after a move - inserts task at new_position and shifts others"""
         try:
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             # Get all tasks in the target quadrant (excluding the moved task)
@@ -645,7 +657,7 @@ class TasksService:
     async def _compact_positions_in_quadrant(self, user_id: str, quadrant: str) -> None:
         """Compact positions in a quadrant after a task is removed - removes gaps"""
         try:
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             # Get all tasks in the quadrant ordered by position
@@ -675,7 +687,7 @@ class TasksService:
     async def _create_subtasks(self, task_id: str, subtasks_data: List[dict], user_id: str) -> List[dict]:
         """Create subtasks for a task"""
         try:
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             created_subtasks = []
@@ -701,7 +713,7 @@ class TasksService:
     async def _update_subtasks(self, task_id: str, subtasks_data: List[dict], user_id: str) -> List[dict]:
         """Update subtasks for a task - handles both creating new and updating existing subtasks"""
         try:
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             # Get existing subtasks to know which ones to update vs create
@@ -758,7 +770,7 @@ class TasksService:
     async def _get_subtasks(self, task_id: str, user_id: str) -> List[dict]:
         """Get all subtasks for a task"""
         try:
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             result = service_db.table("subtasks").select("*").eq("task_id", task_id).order("position").execute()
@@ -772,7 +784,7 @@ class TasksService:
     async def _delete_all_subtasks(self, task_id: str, user_id: str) -> None:
         """Delete all subtasks for a task"""
         try:
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             service_db.table("subtasks").delete().eq("task_id", task_id).execute()
@@ -790,7 +802,7 @@ class TasksService:
             await self.get_task_by_id(task_id, user_id)
             
             # Get current subtask
-            service_db = get_service_client()
+            service_db = self._service_db
             service_db.rpc('set_current_user_id', {'user_id_param': user_id}).execute()
             
             subtask_result = service_db.table("subtasks").select("*").eq("id", subtask_id).eq("task_id", task_id).execute()
@@ -5,13 +5,36 @@ Database connection and Supabase client setup
 import os
 import logging
 from typing import Optional
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, acreate_client, Client, AsyncClient
+from supabase.client import ClientOptions
+from supabase.lib.client_options import AsyncClientOptions
 from api.shared.exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
-# Global Supabase client
+# Global Supabase clients. Each Client owns a persistent httpx session, so
+# reusing one instance keeps TCP+TLS connections pooled across requests
+# instead of re-handshaking per operation.
 _supabase_client: Optional[Client] = None
+_service_client: Optional[Client] = None
+_async_service_client: Optional[AsyncClient] = None
+
+
+def _client_options() -> ClientOptions:
+    """Build client options with an explicitly pooled HTTP session
+
+    Each Supabase client gets its own httpx.Client (auth headers are bound to
+    the session, so it cannot be shared between the anon and service clients)
+    sized for concurrent API traffic with keep-alive connections, so queries
+    reuse warm TLS connections instead of paying handshakes under load.
+    """
+    return ClientOptions(
+        httpx_client=httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(120),
+        )
+    )
 
 
 def get_supabase_client() -> Client:
@@ -26,7 +49,7 @@ def get_supabase_client() -> Client:
             raise DatabaseError("Supabase configuration missing")
         
         try:
-            _supabase_client = create_client(supabase_url, supabase_key)
+            _supabase_client = create_client(supabase_url, supabase_key, options=_client_options())
             logger.info("Supabase client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {e}")
@@ -35,19 +58,68 @@ def get_supabase_client() -> Client:
     return _supabase_client
 
 
+def _async_client_options() -> AsyncClientOptions:
+    """Build async client options with an explicitly pooled HTTP session
+
+    Mirrors _client_options() for the async client: its httpx.AsyncClient is
+    sized identically so awaited queries reuse warm TLS connections.
+    """
+    return AsyncClientOptions(
+        httpx_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(120),
+        )
+    )
+
+
 def get_service_client() -> Client:
-    """Get Supabase client with service role key for admin operations"""
-    supabase_url = os.getenv("SUPABASE_URL")
-    service_key = os.getenv("SUPABASE_SERVICE_KEY")
-    
-    if not supabase_url or not service_key:
-        raise DatabaseError("Supabase service configuration missing")
-    
-    try:
-        return create_client(supabase_url, service_key)
-    except Exception as e:
-        logger.error(f"Failed to initialize Supabase service client: {e}")
-        raise DatabaseError("Failed to connect to database with service role")
+    """Get or create Supabase client with service role key for admin operations"""
+    global _service_client
+
+    if _service_client is None:
+        supabase_url = os.getenv("SUPABASE_URL")
+        service_key = os.getenv("SUPABASE_SERVICE_KEY")
+
+        if not supabase_url or not service_key:
+            raise DatabaseError("Supabase service configuration missing")
+
+        try:
+            _service_client = create_client(supabase_url, service_key, options=_client_options())
+            logger.info("Supabase service client initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize Supabase service client: {e}")
+            raise DatabaseError("Failed to connect to database with service role")
+
+    return _service_client
+
+
+async def get_async_service_client() -> AsyncClient:
+    """Get or create the async Supabase service client
+
+    The async client issues its PostgREST calls with httpx.AsyncClient, so
+    awaiting a query yields the event loop instead of blocking the worker the
+    way the sync client's .execute() does. Request handlers that run queries
+    inline (rather than via asyncio.to_thread) should use this client.
+    """
+    global _async_service_client
+
+    if _async_service_client is None:
+        supabase_url = os.getenv("SUPABASE_URL")
+        service_key = os.getenv("SUPABASE_SERVICE_KEY")
+
+        if not supabase_url or not service_key:
+            raise DatabaseError("Supabase service configuration missing")
+
+        try:
+            _async_service_client = await acreate_client(
+                supabase_url, service_key, options=_async_client_options()
+            )
+            logger.info("Async Supabase service client initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize async Supabase service client: {e}")
+            raise DatabaseError("Failed to connect to database with service role")
+
+    return _async_service_client
 
 
 class DatabaseManager:
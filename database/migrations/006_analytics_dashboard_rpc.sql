@@ -0,0 +1,87 @@
+-- Analytics Dashboard RPC for Quadrant Planner
+-- Assembles the complete analytics dashboard server-side in a single call so
+-- the API does not pay ten separate round trips per dashboard request.
+
+-- =====================================================
+-- ANALYTICS DASHBOARD FUNCTION
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION analytics_dashboard(
+    user_id_param TEXT,
+    period_param TEXT DEFAULT '30_days',
+    start_date_param DATE DEFAULT NULL,
+    end_date_param DATE DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    dashboard JSONB;
+BEGIN
+    SELECT jsonb_build_object(
+        'summary', (
+            SELECT jsonb_build_object(
+                'total_goals', COUNT(*) FILTER (WHERE gs.active_tasks > 0 OR gs.completed_tasks > 0),
+                'total_tasks', COALESCE(SUM(gs.total_tasks), 0),
+                'completed_tasks', COALESCE(SUM(gs.completed_tasks), 0)
+            )
+            FROM goal_stats gs
+            WHERE gs.user_id = user_id_param
+            AND (start_date_param IS NULL OR gs.goal_created_at >= start_date_param)
+            AND (end_date_param IS NULL OR gs.goal_created_at <= end_date_param + INTERVAL '1 day')
+        ),
+        'goal_progress', COALESCE((
+            SELECT jsonb_agg(to_jsonb(gs))
+            FROM goal_stats gs
+            WHERE gs.user_id = user_id_param
+            AND (start_date_param IS NULL OR gs.goal_created_at >= start_date_param)
+            AND (end_date_param IS NULL OR gs.goal_created_at <= end_date_param + INTERVAL '1 day')
+        ), '[]'::jsonb),
+        'quadrant_distribution', (
+            SELECT to_jsonb(qd)
+            FROM quadrant_distribution qd
+            WHERE qd.user_id = user_id_param
+        ),
+        'productivity_trends', COALESCE((
+            SELECT jsonb_agg(to_jsonb(pt) ORDER BY pt.trend_date)
+            FROM productivity_trends pt
+            WHERE pt.user_id = user_id_param
+            AND (start_date_param IS NULL OR pt.trend_date >= start_date_param)
+            AND (end_date_param IS NULL OR pt.trend_date <= end_date_param)
+        ), '[]'::jsonb),
+        'timeframe_analysis', COALESCE((
+            SELECT jsonb_agg(to_jsonb(ta))
+            FROM timeframe_analysis ta
+            WHERE ta.user_id = user_id_param
+        ), '[]'::jsonb),
+        'category_analysis', COALESCE((
+            SELECT jsonb_agg(to_jsonb(ca))
+            FROM category_analysis ca
+            WHERE ca.user_id = user_id_param
+        ), '[]'::jsonb),
+        'priority_analysis', COALESCE((
+            SELECT jsonb_agg(to_jsonb(pa))
+            FROM priority_analysis pa
+            WHERE pa.user_id = user_id_param
+        ), '[]'::jsonb),
+        'overdue_analysis', (
+            SELECT to_jsonb(oa) FROM get_overdue_analysis(user_id_param) oa
+        ),
+        'completion_velocity', (
+            SELECT to_jsonb(cv) FROM get_completion_velocity(user_id_param, period_param) cv
+        ),
+        'staging_analytics', (
+            SELECT to_jsonb(sa) FROM get_staging_analytics(user_id_param) sa
+        ),
+        'productivity_score', (
+            SELECT to_jsonb(ps) FROM calculate_productivity_score(user_id_param) ps
+        )
+    ) INTO dashboard;
+
+    RETURN dashboard;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- GRANT PERMISSIONS
+-- =====================================================
+
+GRANT EXECUTE ON FUNCTION analytics_dashboard(TEXT, TEXT, DATE, DATE) TO authenticated, service_role;
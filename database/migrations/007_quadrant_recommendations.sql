@@ -0,0 +1,50 @@
+-- Quadrant Recommendations RPC for Quadrant Planner
+-- Computes the fixed-threshold quadrant recommendations next to the data so
+-- the API receives a small JSON array instead of branching in Python.
+
+-- =====================================================
+-- QUADRANT RECOMMENDATIONS FUNCTION
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION get_quadrant_recommendations(user_id_param TEXT)
+RETURNS JSONB AS $$
+DECLARE
+    recommendations JSONB;
+BEGIN
+    -- Thresholds compare count * 100 against threshold * total, which only
+    -- needs the count columns every version of the quadrant_distribution
+    -- view defines, and sidesteps division for users with no active tasks
+    SELECT COALESCE(jsonb_agg(message), '[]'::jsonb) INTO recommendations
+    FROM (
+        SELECT unnest(ARRAY[
+            CASE WHEN qd.q1_count * 100.0 > 30 * qd.total_active_tasks THEN
+                'You have too many urgent+important tasks. Focus on prevention and planning.' END,
+            CASE WHEN qd.total_active_tasks > 0 AND qd.q2_count * 100.0 < 40 * qd.total_active_tasks THEN
+                'Increase focus on important but not urgent tasks (Q2) for better long-term results.' END,
+            CASE WHEN qd.q3_count * 100.0 > 25 * qd.total_active_tasks THEN
+                'Too many urgent but unimportant tasks. Consider delegation or elimination.' END,
+            CASE WHEN qd.q4_count * 100.0 > 10 * qd.total_active_tasks THEN
+                'Reduce time-wasting activities in Q4. Focus energy elsewhere.' END,
+            CASE WHEN qd.staging_count * 100.0 > 20 * qd.total_active_tasks THEN
+                'High staging utilization. Process staged items into appropriate quadrants.' END
+        ]) AS message
+        FROM quadrant_distribution qd
+        WHERE qd.user_id = user_id_param
+    ) messages
+    WHERE message IS NOT NULL;
+
+    IF recommendations IS NULL OR recommendations = '[]'::jsonb THEN
+        recommendations := jsonb_build_array(
+            'Great quadrant balance! Maintain this distribution for optimal productivity.'
+        );
+    END IF;
+
+    RETURN recommendations;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- GRANT PERMISSIONS
+-- =====================================================
+
+GRANT EXECUTE ON FUNCTION get_quadrant_recommendations(TEXT) TO authenticated, service_role;
@@ -0,0 +1,131 @@
+-- Materialized analytics views for Quadrant Planner
+-- goal_stats and quadrant_distribution re-aggregate over goals/tasks on every
+-- read; a dashboard build hits them repeatedly per user. Materializing them
+-- (with composite indexes on the lookup columns) turns those reads into index
+-- scans, at the cost of a periodic refresh.
+
+-- =====================================================
+-- GOAL STATS MATERIALIZED VIEW
+-- =====================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS goal_stats_mv AS
+SELECT
+    g.id as goal_id,
+    g.user_id,
+    g.title as goal_title,
+    g.category,
+    g.timeframe,
+    g.color,
+    g.created_at as goal_created_at,
+    COUNT(t.id) as total_tasks,
+    COUNT(CASE WHEN t.completed = true THEN 1 END) as completed_tasks,
+    COUNT(CASE WHEN t.completed = false THEN 1 END) as active_tasks,
+    CASE
+        WHEN COUNT(t.id) > 0 THEN
+            ROUND((COUNT(CASE WHEN t.completed = true THEN 1 END) * 100.0 / COUNT(t.id)), 2)
+        ELSE 0
+    END as completion_rate,
+    CASE
+        WHEN COUNT(CASE WHEN t.completed = false THEN 1 END) > 0 THEN
+            ROUND(AVG(CASE WHEN t.completed = false THEN EXTRACT(days FROM NOW() - t.created_at) END), 1)
+        ELSE 0
+    END as average_task_age,
+    MAX(CASE WHEN t.completed = false THEN t.updated_at END) as last_activity_at
+FROM goals g
+LEFT JOIN tasks t ON g.id = t.goal_id
+WHERE g.archived = false
+GROUP BY g.id, g.user_id, g.title, g.category, g.timeframe, g.color, g.created_at;
+
+-- Unique index required for REFRESH ... CONCURRENTLY, plus the lookup path
+-- used by the API (user_id with an optional goal_created_at range)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_goal_stats_mv_goal_id ON goal_stats_mv (goal_id);
+CREATE INDEX IF NOT EXISTS idx_goal_stats_mv_user_created ON goal_stats_mv (user_id, goal_created_at);
+
+-- =====================================================
+-- QUADRANT DISTRIBUTION MATERIALIZED VIEW
+-- =====================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS quadrant_distribution_mv AS
+SELECT
+    user_id,
+    COUNT(CASE WHEN quadrant = 'Q1' AND completed = false THEN 1 END) as q1_count,
+    COUNT(CASE WHEN quadrant = 'Q2' AND completed = false THEN 1 END) as q2_count,
+    COUNT(CASE WHEN quadrant = 'Q3' AND completed = false THEN 1 END) as q3_count,
+    COUNT(CASE WHEN quadrant = 'Q4' AND completed = false THEN 1 END) as q4_count,
+    COUNT(CASE WHEN quadrant = 'staging' AND completed = false THEN 1 END) as staging_count,
+    COUNT(CASE WHEN completed = false THEN 1 END) as total_active_tasks,
+    -- Per-quadrant percentage columns the API and the recommendations RPC
+    -- read; migration 003's view predates them, so they are added here where
+    -- the view is re-created over the materialized data
+    CASE
+        WHEN COUNT(CASE WHEN completed = false THEN 1 END) > 0 THEN
+            ROUND((COUNT(CASE WHEN quadrant = 'Q1' AND completed = false THEN 1 END) * 100.0 /
+                   COUNT(CASE WHEN completed = false THEN 1 END)), 2)
+        ELSE 0
+    END as q1_percentage,
+    CASE
+        WHEN COUNT(CASE WHEN completed = false THEN 1 END) > 0 THEN
+            ROUND((COUNT(CASE WHEN quadrant = 'Q2' AND completed = false THEN 1 END) * 100.0 /
+                   COUNT(CASE WHEN completed = false THEN 1 END)), 2)
+        ELSE 0
+    END as q2_percentage,
+    CASE
+        WHEN COUNT(CASE WHEN completed = false THEN 1 END) > 0 THEN
+            ROUND((COUNT(CASE WHEN quadrant = 'Q3' AND completed = false THEN 1 END) * 100.0 /
+                   COUNT(CASE WHEN completed = false THEN 1 END)), 2)
+        ELSE 0
+    END as q3_percentage,
+    CASE
+        WHEN COUNT(CASE WHEN completed = false THEN 1 END) > 0 THEN
+            ROUND((COUNT(CASE WHEN quadrant = 'Q4' AND completed = false THEN 1 END) * 100.0 /
+                   COUNT(CASE WHEN completed = false THEN 1 END)), 2)
+        ELSE 0
+    END as q4_percentage,
+    CASE
+        WHEN COUNT(CASE WHEN completed = false THEN 1 END) > 0 THEN
+            ROUND((COUNT(CASE WHEN quadrant = 'staging' AND completed = false THEN 1 END) * 100.0 /
+                   COUNT(CASE WHEN completed = false THEN 1 END)), 2)
+        ELSE 0
+    END as staging_percentage,
+    CASE
+        WHEN COUNT(CASE WHEN completed = false THEN 1 END) > 0 THEN
+            ROUND((COUNT(CASE WHEN quadrant = 'Q2' AND completed = false THEN 1 END) * 100.0 /
+                   COUNT(CASE WHEN completed = false THEN 1 END)), 2)
+        ELSE 0
+    END as q2_focus_percentage
+FROM tasks
+GROUP BY user_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_quadrant_distribution_mv_user ON quadrant_distribution_mv (user_id);
+
+-- =====================================================
+-- VIEWS NOW READ FROM THE MATERIALIZED DATA
+-- =====================================================
+-- The API keeps querying goal_stats / quadrant_distribution, so no client
+-- changes are needed; the views become thin selects over the indexed MVs.
+
+CREATE OR REPLACE VIEW goal_stats AS SELECT * FROM goal_stats_mv;
+CREATE OR REPLACE VIEW quadrant_distribution AS SELECT * FROM quadrant_distribution_mv;
+
+-- =====================================================
+-- REFRESH FUNCTION
+-- =====================================================
+-- Schedule via pg_cron, e.g.:
+--   SELECT cron.schedule('refresh-analytics-mvs', '*/5 * * * *',
+--                        'SELECT refresh_analytics_matviews()');
+
+CREATE OR REPLACE FUNCTION refresh_analytics_matviews()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY goal_stats_mv;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY quadrant_distribution_mv;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- GRANT PERMISSIONS
+-- =====================================================
+
+GRANT SELECT ON goal_stats_mv TO authenticated, service_role;
+GRANT SELECT ON quadrant_distribution_mv TO authenticated, service_role;
+GRANT EXECUTE ON FUNCTION refresh_analytics_matviews() TO service_role;
@@ -0,0 +1,29 @@
+-- Batched Analytics Dashboard RPC for Quadrant Planner
+-- Lets report/admin workflows fetch dashboards for many users with a single
+-- database call instead of N separate dashboard requests.
+
+-- =====================================================
+-- BATCH DASHBOARD FUNCTION
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION analytics_dashboard_batch(
+    user_ids_param TEXT[],
+    period_param TEXT DEFAULT '30_days',
+    start_date_param DATE DEFAULT NULL,
+    end_date_param DATE DEFAULT NULL
+)
+RETURNS TABLE(user_id TEXT, dashboard JSONB) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        uid,
+        analytics_dashboard(uid, period_param, start_date_param, end_date_param)
+    FROM unnest(user_ids_param) AS uid;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- GRANT PERMISSIONS
+-- =====================================================
+
+GRANT EXECUTE ON FUNCTION analytics_dashboard_batch(TEXT[], TEXT, DATE, DATE) TO service_role;
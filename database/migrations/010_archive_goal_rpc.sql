@@ -0,0 +1,40 @@
+-- Atomic goal archiving for Quadrant Planner
+-- delete_goal previously issued two serial writes (archive the goal, then
+-- detach its tasks) as separate HTTP round-trips with no transaction around
+-- them. This function runs both updates in one call, so the API saves a
+-- round-trip and a goal can never be observed archived while tasks still
+-- reference it.
+
+-- =====================================================
+-- ARCHIVE GOAL AND DETACH TASKS FUNCTION
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION archive_goal_and_detach_tasks(
+    goal_id_param UUID,
+    user_id_param TEXT
+)
+RETURNS SETOF goals AS $$
+BEGIN
+    -- Detach tasks first so the returned row reflects the final state;
+    -- both statements commit or roll back together
+    UPDATE tasks
+    SET goal_id = NULL,
+        updated_at = NOW()
+    WHERE goal_id = goal_id_param
+      AND user_id = user_id_param;
+
+    RETURN QUERY
+    UPDATE goals
+    SET archived = TRUE,
+        updated_at = NOW()
+    WHERE id = goal_id_param
+      AND user_id = user_id_param
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- GRANT PERMISSIONS
+-- =====================================================
+
+GRANT EXECUTE ON FUNCTION archive_goal_and_detach_tasks(UUID, TEXT) TO authenticated, service_role;
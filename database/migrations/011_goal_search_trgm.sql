@@ -0,0 +1,13 @@
+-- Trigram index for goal title search
+-- search_goals filters with ilike '%query%'; a leading-wildcard LIKE cannot
+-- use a btree index, so every search sequentially scans the goals table. A
+-- pg_trgm GIN index lets Postgres answer the same ilike predicate with an
+-- index scan - no API-side query change required.
+
+-- =====================================================
+-- TRIGRAM EXTENSION AND INDEX
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_goals_title_trgm ON goals USING gin (title gin_trgm_ops);
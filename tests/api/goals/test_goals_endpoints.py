@@ -204,3 +204,10 @@ class TestGoalsAPI:
         
         # Assertions
         assert response.status_code == 404
+    
+    def test_search_route_declared_before_goal_id(self):
+        """Regression: /search must precede /{goal_id} or it can never match"""
+        from api.goals.routes import router
+
+        paths = [route.path for route in router.routes]
+        assert paths.index("/search") < paths.index("/{goal_id}")
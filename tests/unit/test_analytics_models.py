@@ -0,0 +1,66 @@
+"""
+Unit tests for analytics model behavior
+"""
+
+import json
+
+from api.analytics.models import OverdueByDays, OverdueByQuadrant, QuadrantDistribution
+
+
+class TestQuadrantDistribution:
+    """Test quadrant distribution percentage derivation"""
+
+    def test_derives_percentages_from_counts(self):
+        """Rows without percentage columns get them computed from counts"""
+        distribution = QuadrantDistribution.model_validate({
+            "user_id": "test-user",
+            "q1_count": 1,
+            "q2_count": 3,
+            "q3_count": 0,
+            "q4_count": 0,
+            "staging_count": 0,
+            "total_active_tasks": 4,
+        })
+
+        assert distribution.q1_percentage == 25.0
+        assert distribution.q2_percentage == 75.0
+        assert distribution.q3_percentage == 0.0
+
+    def test_keeps_provided_percentages(self):
+        """Rows that already carry percentages are not recomputed"""
+        distribution = QuadrantDistribution.model_validate({
+            "user_id": "test-user",
+            "q1_count": 1,
+            "total_active_tasks": 1,
+            "q1_percentage": 99.0,
+        })
+
+        assert distribution.q1_percentage == 99.0
+
+    def test_empty_distribution_stays_zero(self):
+        """A user with no tasks gets all-zero percentages, not an error"""
+        distribution = QuadrantDistribution.model_validate({
+            "user_id": "test-user",
+            "total_active_tasks": 0,
+        })
+
+        assert distribution.q1_percentage == 0.0
+        assert distribution.staging_percentage == 0.0
+
+
+class TestOverdueSerializationAliases:
+    """Test the overdue breakdowns keep their original response keys"""
+
+    def test_quadrant_keys_serialize_uppercase(self):
+        """Responses use the original Q1..Q4 keys, whatever the input casing"""
+        breakdown = OverdueByQuadrant.model_validate({"Q1": 2, "q2": 1})
+
+        payload = json.loads(breakdown.model_dump_json(by_alias=True))
+        assert payload == {"Q1": 2, "Q2": 1, "Q3": 0, "Q4": 0, "staging": 0}
+
+    def test_day_bucket_keys_serialize_with_leading_digits(self):
+        """Responses keep the digit-first bucket keys like 1_7_days"""
+        breakdown = OverdueByDays.model_validate({"1_7_days": 3, "days_8_30": 1})
+
+        payload = json.loads(breakdown.model_dump_json(by_alias=True))
+        assert payload == {"1_7_days": 3, "8_30_days": 1, "over_30_days": 0}